@@ -26,11 +26,11 @@ from poiesis.api.tes.models import (
 from poiesis.api.utils import pydantic_to_dict_response
 from poiesis.cli.utils import get_version
 from poiesis.constants import PoesisConstants
-from poiesis.repository.mongo import MongoDBClient
+from poiesis.repository.mongo import get_mongo_client
 
 constants = PoesisConstants()
 
-db = MongoDBClient()
+db = get_mongo_client()
 
 
 @pydantic_to_dict_response
@@ -4,6 +4,7 @@ This module creates and configures the connexion app.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from connexion import AsyncApp
@@ -16,11 +17,28 @@ from poiesis.api.exceptions import (
     handle_unexpected_exception,
 )
 from poiesis.constants import get_poiesis_constants
+from poiesis.repository.mongo import get_mongo_client
 
 constants = get_poiesis_constants()
 api_constant = get_poiesis_api_constants()
 
 
+@asynccontextmanager
+async def _lifespan(app: AsyncApp):
+    """Run one-off startup and shutdown work around serving requests.
+
+    Args:
+        app: The connexion app.
+    """
+    db = get_mongo_client()
+    # Fail fast on a bad URI/credentials rather than on the first request.
+    await db.ping()
+    await db.ensure_indexes()
+    yield
+    # Tear the pool down so sockets don't linger across restarts.
+    await db.close()
+
+
 def create_app() -> AsyncApp:
     """Create the connexion app.
 
@@ -34,6 +52,7 @@ def create_app() -> AsyncApp:
     app = AsyncApp(
         __name__,
         specification_dir=openapi_spec_directory,
+        lifespan=_lifespan,
     )
 
     app.add_api(
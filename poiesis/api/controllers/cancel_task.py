@@ -9,7 +9,7 @@ from kubernetes.client.exceptions import ApiException
 from poiesis.api.controllers.interface import InterfaceController
 from poiesis.api.exceptions import BadRequestException, NotFoundException
 from poiesis.api.tes.models import TesCancelTaskResponse, TesState
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
+from poiesis.core.adaptors.kubernetes.kubernetes import get_kubernetes_client
 from poiesis.core.constants import get_poiesis_core_constants
 from poiesis.repository.mongo import MongoDBClient
 
@@ -45,7 +45,7 @@ class CancelTaskController(InterfaceController):
         self.db = db
         self.task_id = task_id
         self.user_id = user_id
-        self.kubernetes_client = KubernetesAdapter()
+        self.kubernetes_client = get_kubernetes_client()
 
     async def _clean_task_resources_and_set_final_state(self) -> None:
         """Clean up the task resources and set final state."""
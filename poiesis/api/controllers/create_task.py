@@ -1,7 +1,6 @@
 """Controller for creating a task."""
 
 import asyncio
-import json
 import logging
 import uuid
 from typing import Any
@@ -29,7 +28,7 @@ from poiesis.api.tes.models import (
     TesTask,
 )
 from poiesis.constants import get_poiesis_constants
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
+from poiesis.core.adaptors.kubernetes.kubernetes import get_kubernetes_client
 from poiesis.core.constants import (
     get_configmap_names,
     get_infrastructure_container_security_context,
@@ -69,7 +68,7 @@ class CreateTaskController(InterfaceController):
         self.db = db
         self.task = task
         self.user_id = user_id
-        self.kubernetes_client = KubernetesAdapter()
+        self.kubernetes_client = get_kubernetes_client()
 
     async def execute(self, *args: Any, **kwargs: Any) -> TesCreateTaskResponse:
         """Execute the controller."""
@@ -92,9 +91,7 @@ class CreateTaskController(InterfaceController):
                 namespace=core_constants.K8s.K8S_NAMESPACE,
             ),
             data={
-                core_constants.K8s.TES_TASK_CONFIGMAP_KEY: json.dumps(
-                    self.task.model_dump()
-                )
+                core_constants.K8s.TES_TASK_CONFIGMAP_KEY: self.task.model_dump_json()
             },
         )
         return await self.kubernetes_client.create_config_map(configmap)
@@ -1,6 +1,5 @@
 """TExAM service CLI commands."""
 
-import asyncio
 import json
 from typing import Any
 
@@ -9,6 +8,7 @@ from pydantic import ValidationError
 
 from poiesis.api.tes.models import TesTask
 from poiesis.cli.commands.poiesis.base import BaseCommand
+from poiesis.cli.utils import run_async
 from poiesis.core.constants import get_tes_task_request_path
 from poiesis.core.services.texam.texam import Texam
 
@@ -42,7 +42,7 @@ class TexamCommand(BaseCommand):
                 ) from e
 
             click.echo(f"Executing TExAM task: {_task.id}")
-            asyncio.run(Texam(_task).execute())
+            run_async(Texam(_task).execute())
 
     def get_info(self) -> dict[str, Any]:
         """Get TExAM service information.
@@ -1,6 +1,5 @@
 """TIF service CLI commands."""
 
-import asyncio
 import json
 from typing import Any
 
@@ -9,6 +8,7 @@ from pydantic import ValidationError
 
 from poiesis.api.tes.models import TesTask
 from poiesis.cli.commands.poiesis.base import BaseCommand
+from poiesis.cli.utils import run_async
 from poiesis.core.constants import get_tes_task_request_path
 from poiesis.core.services.filer.filer_strategy_factory import STRATEGY_MAP
 from poiesis.core.services.filer.tif import Tif
@@ -47,7 +47,7 @@ class TifCommand(BaseCommand):
                 click.echo("--------------------------")
 
                 click.echo("Downloading input files...")
-                asyncio.run(Tif(tes_task.id, _inputs).execute())
+                run_async(Tif(tes_task.id, _inputs).execute())
 
             except json.JSONDecodeError as e:
                 raise click.ClickException(f"JSON parsing error: {str(e)}") from e
@@ -1,6 +1,5 @@
 """TOF service CLI commands."""
 
-import asyncio
 import json
 from typing import Any
 
@@ -9,6 +8,7 @@ from pydantic import ValidationError
 
 from poiesis.api.tes.models import TesTask
 from poiesis.cli.commands.poiesis.base import BaseCommand
+from poiesis.cli.utils import run_async
 from poiesis.core.constants import get_tes_task_request_path
 from poiesis.core.services.filer.filer_strategy_factory import STRATEGY_MAP
 from poiesis.core.services.filer.tof import Tof
@@ -46,7 +46,7 @@ class TofCommand(BaseCommand):
                 click.echo("--------------------------")
 
                 click.echo("Uploading output files...")
-                asyncio.run(Tof(tes_task.id, _outputs).execute())
+                run_async(Tof(tes_task.id, _outputs).execute())
 
             except json.JSONDecodeError as e:
                 raise click.ClickException(f"JSON parsing error: {str(e)}") from e
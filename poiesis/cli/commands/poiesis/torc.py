@@ -1,6 +1,5 @@
 """Torc service CLI commands."""
 
-import asyncio
 import json
 from typing import Any
 
@@ -9,6 +8,7 @@ from pydantic import ValidationError
 
 from poiesis.api.tes.models import TesTask
 from poiesis.cli.commands.poiesis.base import BaseCommand
+from poiesis.cli.utils import run_async
 from poiesis.core.constants import get_tes_task_request_path
 from poiesis.core.services.torc.torc import Torc
 
@@ -40,7 +40,7 @@ class TorcCommand(BaseCommand):
                 click.echo(f"Name: {tes_task.name}")
                 click.echo("---------------------------")
 
-                asyncio.run(Torc(tes_task).execute())
+                run_async(Torc(tes_task).execute())
 
             except json.JSONDecodeError as e:
                 raise click.ClickException(f"JSON parsing error: {str(e)}") from e
@@ -1,5 +1,7 @@
 """Info retrieval for CLI commands."""
 
+import asyncio
+from collections.abc import Coroutine
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,24 @@ api_constants = get_poiesis_api_constants()
 constants = get_poiesis_constants()
 
 
+def run_async(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a service coroutine to completion on the best available loop.
+
+    Uses uvloop's event loop when the optional dependency is installed —
+    the services are dominated by K8s API and Redis I/O, where it cuts
+    per-operation syscall overhead — and falls back to the stdlib loop
+    otherwise.
+
+    Args:
+        coroutine: The service entrypoint coroutine to run.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coroutine)
+    return uvloop.run(coroutine)
+
+
 @lru_cache
 def get_version() -> str:
     """Get version from pyproject.toml."""
@@ -43,6 +43,15 @@ class PoesisConstants:
                 SERVICE_COLLECTION: The name of the services collection.
                 DATABASE: The name of the database to use.
                 MAX_POOL_SIZE: The maximum number of connections to the database.
+                MIN_POOL_SIZE: Connections kept open while idle, so bursts
+                    don't pay the handshake cost.
+                MAX_IDLE_TIME_MS: How long a surplus connection may idle
+                    before the pool closes it.
+                WAIT_QUEUE_TIMEOUT_MS: How long an operation waits for a
+                    free connection before failing instead of queueing
+                    indefinitely.
+                SERVER_SELECTION_TIMEOUT_MS: How long the driver retries
+                    server selection before surfacing an error.
                 HOST: Host for the mango instance.
                 PORT: Port for the mongo instance.
             """
@@ -51,6 +60,16 @@ class PoesisConstants:
             SERVICE_COLLECTION: str = "services"
             DATABASE: str = os.environ.get("MONGODB_DATABASE", "poiesis")
             MAX_POOL_SIZE: int = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "10"))
+            MIN_POOL_SIZE: int = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "2"))
+            MAX_IDLE_TIME_MS: int = int(
+                os.environ.get("MONGODB_MAX_IDLE_TIME_MS", "60000")
+            )
+            WAIT_QUEUE_TIMEOUT_MS: int = int(
+                os.environ.get("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "5000")
+            )
+            SERVER_SELECTION_TIMEOUT_MS: int = int(
+                os.environ.get("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "3000")
+            )
 
 
 @lru_cache
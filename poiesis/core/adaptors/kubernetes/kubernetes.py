@@ -1,8 +1,12 @@
 """Kubernetes adaptor."""
 
 import asyncio
+import contextlib
 import logging
+import os
+from functools import lru_cache
 from http import HTTPStatus
+from typing import Any
 
 from kubernetes import client, config
 from kubernetes.client.exceptions import ApiException
@@ -14,10 +18,19 @@ core_constants = get_poiesis_core_constants()
 
 logger = logging.getLogger(__name__)
 
+# Cap on in-flight Kubernetes API calls per process so a burst of tasks
+# doesn't hammer the apiserver into rate-limiting us; shared by every
+# adaptor method via `_call`.
+_api_semaphore = asyncio.Semaphore(int(os.environ.get("POIESIS_K8S_CONCURRENCY", "32")))
+
 
 class KubernetesAdapter(KubernetesPort):
     """Kubernetes adaptor.
 
+    The stock kubernetes client is synchronous, so every API call here is
+    dispatched through `asyncio.to_thread`; nothing in this adaptor may call
+    the client directly from the event loop.
+
     Attributes:
         core_api: The Kubernetes Core API
         batch_api: The Kubernetes Batch API
@@ -42,10 +55,29 @@ class KubernetesAdapter(KubernetesPort):
                     "Could not configure Kubernetes client. "
                     "Neither in-cluster config nor kube config file is available."
                 ) from e
-        self.core_api = client.CoreV1Api()
-        self.batch_api = client.BatchV1Api()
+        # Size the urllib3 pool to the concurrency cap so parallel calls
+        # reuse keep-alive connections instead of queueing on the default
+        # small pool or opening throwaway sockets.
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = int(
+            os.environ.get("POIESIS_K8S_CONCURRENCY", "32")
+        )
+        api_client = client.ApiClient(configuration)
+        self.core_api = client.CoreV1Api(api_client)
+        self.batch_api = client.BatchV1Api(api_client)
         self.namespace = core_constants.K8s.K8S_NAMESPACE
 
+    @staticmethod
+    async def _call(fn, /, **kwargs):
+        """Run a blocking client call in a thread, bounded by the API cap.
+
+        Args:
+            fn: The synchronous kubernetes client method to invoke.
+            kwargs: Arguments forwarded to the client method.
+        """
+        async with _api_semaphore:
+            return await asyncio.to_thread(fn, **kwargs)
+
     async def create_job(self, job: client.V1Job) -> client.V1Job:
         """Create a Kubernetes Job.
 
@@ -53,7 +85,7 @@ class KubernetesAdapter(KubernetesPort):
             job: The Kubernetes Job object.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.batch_api.create_namespaced_job, namespace=self.namespace, body=job
             )
             assert job.metadata is not None, "Job should have metadata"
@@ -76,7 +108,7 @@ class KubernetesAdapter(KubernetesPort):
             name: The name of the Job.
         """
         try:
-            return await asyncio.to_thread(
+            return await self._call(
                 self.batch_api.read_namespaced_job, name=name, namespace=self.namespace
             )
         except ApiException as e:
@@ -92,7 +124,7 @@ class KubernetesAdapter(KubernetesPort):
             configmap: The ConfigMap object.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.create_namespaced_config_map,
                 namespace=self.namespace,
                 body=configmap,
@@ -118,7 +150,7 @@ class KubernetesAdapter(KubernetesPort):
                 (with changes such as ownerReferences).
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.patch_namespaced_config_map,
                 name=name,
                 namespace=self.namespace,
@@ -140,7 +172,7 @@ class KubernetesAdapter(KubernetesPort):
             pvc: The Persistent Volume Claim object.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.create_namespaced_persistent_volume_claim,
                 namespace=self.namespace,
                 body=pvc,
@@ -165,7 +197,7 @@ class KubernetesAdapter(KubernetesPort):
             return
 
         try:
-            await asyncio.to_thread(
+            await self._call(
                 self.core_api.delete_namespaced_persistent_volume_claim,
                 name=name,
                 namespace=self.namespace,
@@ -183,7 +215,7 @@ class KubernetesAdapter(KubernetesPort):
             pod: The pod object.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.create_namespaced_pod, namespace=self.namespace, body=pod
             )
             assert pod.metadata is not None, "Pod should have metadata"
@@ -206,7 +238,7 @@ class KubernetesAdapter(KubernetesPort):
             name: The name of the pod.
         """
         try:
-            return await asyncio.to_thread(
+            return await self._call(
                 self.core_api.read_namespaced_pod, name=name, namespace=self.namespace
             )
         except ApiException as e:
@@ -220,7 +252,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.list_namespaced_pod,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -238,7 +270,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.list_namespaced_pod,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -256,7 +288,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.batch_api.list_namespaced_job,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -276,7 +308,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            api_response = await asyncio.to_thread(
+            api_response = await self._call(
                 self.core_api.list_namespaced_persistent_volume_claim,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -294,7 +326,7 @@ class KubernetesAdapter(KubernetesPort):
             name: The name of the pod.
         """
         try:
-            return await asyncio.to_thread(
+            return await self._call(
                 self.core_api.read_namespaced_pod_log,
                 name=name,
                 namespace=self.namespace,
@@ -303,17 +335,73 @@ class KubernetesAdapter(KubernetesPort):
             logger.error(f"Error getting pod logs: {e}")
             raise
 
-    async def delete_job(self, name: str) -> None:
+    async def stream_pod_log(self, name: str) -> str:
+        """Stream the log of a pod incrementally until it terminates.
+
+        Follows the log while the pod runs instead of downloading the whole
+        body in one shot after completion.
+
+        Args:
+            name: The name of the pod.
+        """
+        # Shared with the worker thread so cancellation can reach the
+        # blocking read: Task.cancel() alone cannot interrupt it.
+        holder: dict[str, Any] = {}
+
+        def _stream() -> str:
+            response = self.core_api.read_namespaced_pod_log(
+                name=name,
+                namespace=self.namespace,
+                follow=True,
+                _preload_content=False,
+            )
+            holder["response"] = response
+            chunks: list[bytes] = []
+            try:
+                for chunk in response.stream():
+                    chunks.append(chunk)
+            except Exception:
+                # The read only breaks early when the response was closed
+                # from the event loop on cancellation; anything else is a
+                # real streaming failure.
+                if not holder.get("cancelled"):
+                    raise
+            finally:
+                response.release_conn()
+            return b"".join(chunks).decode("utf-8")
+
+        try:
+            # Deliberately not routed through `_call`: the follow lasts for
+            # the pod's whole lifetime and would pin a semaphore slot.
+            return await asyncio.to_thread(_stream)
+        except asyncio.CancelledError:
+            # Unblock the worker thread by closing the response it is
+            # reading from, then let the cancellation propagate.
+            holder["cancelled"] = True
+            if (response := holder.get("response")) is not None:
+                with contextlib.suppress(Exception):
+                    response.close()
+            raise
+        except ApiException as e:
+            logger.error(f"Error streaming pod logs: {e}")
+            raise
+
+    async def delete_job(
+        self, name: str, propagation_policy: str | None = None
+    ) -> None:
         """Delete a job.
 
         Args:
             name: The name of the job.
+            propagation_policy: Deletion propagation policy, e.g. 'Background'
+                to have dependent pods garbage collected without blocking.
         """
         try:
-            await asyncio.to_thread(
+            await self._call(
                 self.batch_api.delete_namespaced_job,
                 name=name,
                 namespace=self.namespace,
+                propagation_policy=propagation_policy,
             )
             logger.debug(f"Deleted job {name} from namespace {self.namespace}")
         except ApiException as e:
@@ -328,7 +416,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            await asyncio.to_thread(
+            await self._call(
                 self.batch_api.delete_collection_namespaced_job,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -353,7 +441,7 @@ class KubernetesAdapter(KubernetesPort):
             deleted before the PVC is removed.
         """
         try:
-            await asyncio.to_thread(
+            await self._call(
                 self.core_api.delete_collection_namespaced_persistent_volume_claim,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -375,7 +463,7 @@ class KubernetesAdapter(KubernetesPort):
             label_selector: The label selector.
         """
         try:
-            await asyncio.to_thread(
+            await self._call(
                 self.core_api.delete_collection_namespaced_pod,
                 namespace=self.namespace,
                 label_selector=label_selector,
@@ -388,3 +476,15 @@ class KubernetesAdapter(KubernetesPort):
             if e.status != HTTPStatus.NOT_FOUND:
                 logger.error(f"Error deleting pods by label: {e}")
                 raise
+
+
+@lru_cache
+def get_kubernetes_client() -> KubernetesAdapter:
+    """Get the process-wide shared Kubernetes adaptor.
+
+    Each adaptor carries its own HTTPS connection pool, so services that run
+    in the same process (Torc and its sub-executions, Texam, the repository)
+    should share one instance instead of paying the config load and TLS
+    handshakes again.
+    """
+    return KubernetesAdapter()
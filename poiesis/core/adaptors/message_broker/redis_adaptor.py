@@ -2,22 +2,98 @@
 
 import json
 import os
+import time
 from collections.abc import Iterator
+from functools import lru_cache
+from typing import cast
 
 import redis
+import redis.asyncio
 
 from poiesis.core.constants import get_poiesis_core_constants
 from poiesis.core.ports.message_broker import Message, MessageBroker
 
 core_constants = get_poiesis_core_constants()
 
+# Stage completion events live in one Redis Stream per stage per task.
+# Unlike pub/sub, a stream retains the event until it expires, so Torc still
+# sees a completion that was published before it started waiting.
+_STREAM_KEY_PREFIX = "poiesis:stage:"
+_STREAM_TTL_SECONDS = 24 * 60 * 60
+
+# Shape of an XREAD reply: [(stream key, [(entry id, fields)])]. The redis
+# client's own annotations collapse to a union the type checker can't narrow,
+# so both read loops cast their replies to this.
+_StreamEntries = list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]
+
+
+@lru_cache
+def _get_redis_connection() -> redis.Redis:
+    """Get the process-wide shared Redis connection.
+
+    One task spawns several broker instances (Torc plus one per stage
+    template); they can all multiplex over a single connection pool instead
+    of each paying a TCP connect and auth round-trip.
+    """
+    host = os.getenv("MESSAGE_BROKER_HOST")
+    port = os.getenv("MESSAGE_BROKER_PORT")
+
+    if not host or not port:
+        raise RuntimeError(
+            "Redis configuration is incomplete: both MESSAGE_BROKER_HOST"
+            " and MESSAGE_BROKER_PORT are required."
+        )
+
+    password = os.getenv("MESSAGE_BROKER_PASSWORD")
+
+    if password:
+        return redis.Redis(
+            host=host,
+            port=int(port),
+            password=password,
+        )
+    return redis.Redis(
+        host=host,
+        port=int(port),
+    )
+
+
+@lru_cache
+def _get_async_redis_connection() -> redis.asyncio.Redis:
+    """Get the process-wide shared async Redis connection.
+
+    Counterpart of `_get_redis_connection` for consumers that live on the
+    event loop; built lazily so processes that never await a message don't
+    open a second connection.
+    """
+    host = os.getenv("MESSAGE_BROKER_HOST")
+    port = os.getenv("MESSAGE_BROKER_PORT")
+
+    if not host or not port:
+        raise RuntimeError(
+            "Redis configuration is incomplete: both MESSAGE_BROKER_HOST"
+            " and MESSAGE_BROKER_PORT are required."
+        )
+
+    password = os.getenv("MESSAGE_BROKER_PASSWORD")
+
+    if password:
+        return redis.asyncio.Redis(
+            host=host,
+            port=int(port),
+            password=password,
+        )
+    return redis.asyncio.Redis(
+        host=host,
+        port=int(port),
+    )
+
 
 class RedisMessageBroker(MessageBroker):
     """Redis message broker.
 
     Attributes:
         redis: The Redis client
-        pubsub: The Redis pubsub client
     """
 
     def __init__(self):
@@ -25,62 +101,112 @@ class RedisMessageBroker(MessageBroker):
 
         Attributes:
             redis: The Redis client
-            pubsub: The Redis pubsub client
         """
-        host = os.getenv("MESSAGE_BROKER_HOST")
-        port = os.getenv("MESSAGE_BROKER_PORT")
-
-        if not host or not port:
-            raise RuntimeError(
-                "Redis configuration is incomplete: both MESSAGE_BROKER_HOST"
-                " and MESSAGE_BROKER_PORT are required."
-            )
-
-        password = os.getenv("MESSAGE_BROKER_PASSWORD")
-
-        if password:
-            self.redis = redis.Redis(
-                host=host,
-                port=int(port),
-                password=password,
-            )
-        else:
-            self.redis = redis.Redis(
-                host=host,
-                port=int(port),
-            )
-
-        self.pubsub = self.redis.pubsub()
+        self.redis = _get_redis_connection()
 
     def publish(self, channel: str, message: Message) -> None:
         """Publish a message to a channel.
 
+        Appends to the channel's stream so the event survives until read
+        even if the consumer hasn't attached yet; the stream expires with
+        the task instead of being acknowledged entry by entry.
+
         Args:
             channel: The channel/topic to publish to
             message: The message to publish
         """
-        self.redis.publish(channel, message.to_json())
+        key = _STREAM_KEY_PREFIX + channel
+        pipe = self.redis.pipeline()
+        pipe.xadd(key, {"payload": message.to_json()})
+        pipe.expire(key, _STREAM_TTL_SECONDS)
+        pipe.execute()
 
     def subscribe(self, channel: str) -> Iterator[Message]:
         """Subscribe to a channel.
 
+        Reads the channel's stream from the beginning, so messages published
+        before the subscriber attached are delivered too.
+
         Args:
             channel: The channel/topic to subscribe to
 
         Returns:
-            An async iterator of messages
+            An iterator of messages
         """
-        self.pubsub.subscribe(channel)
-        for message in self.pubsub.listen():
-            if message["type"] == "message":
-                data = message["data"]
-                if data is not None:
-                    if isinstance(data, bytes):
-                        data = data.decode("utf-8")
-                    yield Message(**json.loads(data))
+        key = _STREAM_KEY_PREFIX + channel
+        last_id = "0"
+        while True:
+            entries = cast(
+                _StreamEntries, self.redis.xread({key: last_id}, count=16, block=1000)
+            )
+            for _, events in entries:
+                for event_id, fields in events:
+                    last_id = event_id
+                    parsed = self._parse(fields.get(b"payload"))
+                    if parsed is not None:
+                        yield parsed
+
+    @staticmethod
+    def _parse(data: bytes | str | None) -> Message | None:
+        """Decode a raw pub/sub payload into a Message.
+
+        Args:
+            data: The raw message payload from Redis.
+        """
+        if data is None:
+            return None
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return Message(**json.loads(data))
+
+    async def wait_for(
+        self, channel: str, timeout: float | None = None
+    ) -> Message | None:
+        """Wait until a message arrives on a channel.
+
+        Blocks server-side on the channel's stream via the async Redis
+        client, starting from the beginning of the stream so a completion
+        published before this consumer attached is not lost.
+
+        Args:
+            channel: The channel/topic to wait on.
+            timeout: Overall deadline in seconds, or None to wait forever.
+
+        Returns:
+            The first message published on the channel, or None if the
+            deadline expired first.
+        """
+        connection = _get_async_redis_connection()
+        key = _STREAM_KEY_PREFIX + channel
+        last_id = "0"
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while deadline is None or time.monotonic() < deadline:
+            entries = cast(
+                _StreamEntries,
+                await connection.xread({key: last_id}, count=1, block=1000),
+            )
+            for _, events in entries:
+                for event_id, fields in events:
+                    last_id = event_id
+                    parsed = self._parse(fields.get(b"payload"))
+                    if parsed is not None:
+                        return parsed
+        return None
 
     def close(self) -> None:
-        """Close the message broker."""
-        self.pubsub.close()
-        self.redis.close()
-        del self
+        """Close the message broker.
+
+        The underlying connection is shared by every broker in the process
+        and stays open; there is no per-instance state to tear down.
+        """
+
+
+@lru_cache
+def get_redis_message_broker() -> RedisMessageBroker:
+    """Get the process-wide shared Redis message broker.
+
+    The broker holds no per-task state — streams are keyed by channel — so
+    every service in the process can share one instance, like the Kubernetes
+    and Mongo client factories.
+    """
+    return RedisMessageBroker()
@@ -2,7 +2,6 @@
 
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -46,14 +45,18 @@ class MessageBroker(ABC):
         pass
 
     @abstractmethod
-    def subscribe(self, channel: str) -> Iterator[Message]:
-        """Subscribe to a channel and yield messages as they arrive.
+    async def wait_for(
+        self, channel: str, timeout: float | None = None
+    ) -> Message | None:
+        """Wait until a message arrives on a channel.
 
         Args:
-            channel: The channel/topic to subscribe to
+            channel: The channel/topic to wait on
+            timeout: Overall deadline in seconds, or None to wait forever
 
         Returns:
-            Iterator yielding messages as they arrive
+            The first message published on the channel, or None if the
+            deadline expired first
         """
         pass
 
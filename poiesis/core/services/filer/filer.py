@@ -4,7 +4,9 @@ import logging
 import sys
 from abc import ABC, abstractmethod
 
-from poiesis.core.adaptors.message_broker.redis_adaptor import RedisMessageBroker
+from poiesis.core.adaptors.message_broker.redis_adaptor import (
+    get_redis_message_broker,
+)
 from poiesis.core.ports.message_broker import Message, MessageStatus
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,7 @@ class Filer(ABC):
             message_broker: Message broker
             name: Name of the filer
         """
-        self.message_broker = RedisMessageBroker()
+        self.message_broker = get_redis_message_broker()
 
     async def execute(self):
         """Execute the filer.
@@ -60,11 +62,18 @@ class Filer(ABC):
         """Name of the filer."""
         pass
 
+    @property
+    @abstractmethod
+    def channel(self) -> str:
+        """Broker channel this filer reports on.
+
+        Scoped per stage (the filer's job name) so TORC's wait for this
+        stage can't be satisfied by another stage's message on the same
+        task.
+        """
+        pass
+
     def message(self, message: Message):
         """Message logic, send a message to TORC."""
-        # TODO: Change this to id, it shouldn't be name
-        if not hasattr(self, "name"):
-            logger.error("The name attribute is not set")
-            raise AttributeError("The name attribute is not set.")
         logger.info(f"Sending message to TORC: {message}")
-        self.message_broker.publish(self.name, message)
+        self.message_broker.publish(self.channel, message)
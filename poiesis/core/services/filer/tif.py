@@ -1,12 +1,15 @@
 """Entry point for the TIF service."""
 
+import asyncio
 import logging
 
 from poiesis.api.tes.models import TesInput
+from poiesis.core.constants import get_poiesis_core_constants
 from poiesis.core.ports.message_broker import Message, MessageStatus
 from poiesis.core.services.filer.filer import Filer
 from poiesis.core.services.filer.filer_strategy_factory import FilerStrategyFactory
 
+core_constants = get_poiesis_core_constants()
 logger = logging.getLogger(__name__)
 
 
@@ -44,21 +47,40 @@ class Tif(Filer):
         """Name of the filer."""
         return self._name
 
+    @property
+    def channel(self) -> str:
+        """Stage-scoped channel, same as the Tif job name."""
+        return f"{core_constants.K8s.TIF_PREFIX}-{self.name}"
+
     async def file(self) -> None:
         """Filing logic, download.
 
+        Inputs are independent transfers, so they are downloaded
+        concurrently; the task completes in the time of the slowest
+        input instead of the sum of all of them.
+
+        Raises:
+            Exception: If any file cannot be downloaded.
+        """
+        await asyncio.gather(*(self._download(input) for input in self.inputs))
+
+    async def _download(self, input: TesInput) -> None:
+        """Download a single input.
+
+        Args:
+            input: The task input to download.
+
         Raises:
             Exception: If the file cannot be downloaded.
         """
-        for input in self.inputs:
-            logger.info(f"Downloading {input.url} to {input.path}")
-            filer_strategy = FilerStrategyFactory.create_strategy(input.url, input)
-            logger.debug(f"Filer strategy: {filer_strategy.__class__.__name__}")
-            try:
-                await filer_strategy.download()
-            except Exception as e:
-                logger.error(f"Error downloading {input.url}: {str(e)}")
-                self.message(
-                    Message(status=MessageStatus.ERROR, message=f"TIF failed: {str(e)}")
-                )
-                raise
+        logger.info(f"Downloading {input.url} to {input.path}")
+        filer_strategy = FilerStrategyFactory.create_strategy(input.url, input)
+        logger.debug(f"Filer strategy: {filer_strategy.__class__.__name__}")
+        try:
+            await filer_strategy.download()
+        except Exception as e:
+            logger.error(f"Error downloading {input.url}: {str(e)}")
+            self.message(
+                Message(status=MessageStatus.ERROR, message=f"TIF failed: {str(e)}")
+            )
+            raise
@@ -1,12 +1,15 @@
 """Entry point for the TOF service."""
 
+import asyncio
 import logging
 
 from poiesis.api.tes.models import TesOutput
+from poiesis.core.constants import get_poiesis_core_constants
 from poiesis.core.ports.message_broker import Message
 from poiesis.core.services.filer.filer import Filer
 from poiesis.core.services.filer.filer_strategy_factory import FilerStrategyFactory
 
+core_constants = get_poiesis_core_constants()
 logger = logging.getLogger(__name__)
 
 
@@ -44,18 +47,37 @@ class Tof(Filer):
         """Name of the filer."""
         return self._name
 
+    @property
+    def channel(self) -> str:
+        """Stage-scoped channel, same as the Tof job name."""
+        return f"{core_constants.K8s.TOF_PREFIX}-{self.name}"
+
     async def file(self) -> None:
         """Filing logic, upload.
 
+        Outputs are independent transfers, so they are uploaded
+        concurrently; the task completes in the time of the slowest
+        output instead of the sum of all of them.
+
+        Raises:
+            Exception: If any file cannot be uploaded.
+        """
+        await asyncio.gather(*(self._upload(output) for output in self.outputs))
+
+    async def _upload(self, output: TesOutput) -> None:
+        """Upload a single output.
+
+        Args:
+            output: The task output to upload.
+
         Raises:
             Exception: If the file cannot be uploaded.
         """
-        for output in self.outputs:
-            filer_strategy = FilerStrategyFactory.create_strategy(output.url, output)
-            try:
-                logger.info(f"Uploading output: {output}")
-                await filer_strategy.upload()
-            except Exception as e:
-                logger.error(f"TOF failed: {e}")
-                self.message(Message(f"TOF failed: {e}"))
-                raise
+        filer_strategy = FilerStrategyFactory.create_strategy(output.url, output)
+        try:
+            logger.info(f"Uploading output: {output}")
+            await filer_strategy.upload()
+        except Exception as e:
+            logger.error(f"TOF failed: {e}")
+            self.message(Message(f"TOF failed: {e}"))
+            raise
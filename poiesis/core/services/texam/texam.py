@@ -1,10 +1,15 @@
 """TExAM (Task Executor and Monitor) service."""
 
 import asyncio
+import contextlib
+import copy
 import logging
 import os
+import random
+import re
 import shlex
-from pathlib import Path
+import time
+from http import HTTPStatus
 
 from kubernetes import watch  # type: ignore
 from kubernetes.client import (
@@ -20,14 +25,17 @@ from kubernetes.client import (
     V1Volume,
     V1VolumeMount,
 )
+from kubernetes.client.exceptions import ApiException
 
 from poiesis.api.tes.models import (
     TesExecutor,
     TesFileType,
     TesTask,
 )
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
-from poiesis.core.adaptors.message_broker.redis_adaptor import RedisMessageBroker
+from poiesis.core.adaptors.kubernetes.kubernetes import get_kubernetes_client
+from poiesis.core.adaptors.message_broker.redis_adaptor import (
+    get_redis_message_broker,
+)
 from poiesis.core.constants import (
     get_executor_container_security_context,
     get_executor_pod_security_context,
@@ -37,12 +45,24 @@ from poiesis.core.constants import (
 )
 from poiesis.core.ports.message_broker import Message, MessageStatus
 from poiesis.core.services.models import PodPhase
-from poiesis.repository.mongo import MongoDBClient
+from poiesis.repository.mongo import get_mongo_client
 
 core_constants = get_poiesis_core_constants()
 
 logger = logging.getLogger(__name__)
 
+# Characters that never need shell quoting, cf. shlex._find_unsafe.
+_SAFE_ARG_RE = re.compile(r"\A[A-Za-z0-9_@%+=:,./-]+\Z")
+
+
+def _quote(arg: str) -> str:
+    """Quote an argument for the shell, skipping already-safe arguments.
+
+    `shlex.quote` allocates a new string even for plain alphanumeric/path
+    arguments; the common case is safe and can be returned as-is.
+    """
+    return arg if _SAFE_ARG_RE.match(arg) else shlex.quote(arg)
+
 
 class Texam:
     """TExAM service.
@@ -58,6 +78,7 @@ class Texam:
         failed: Flag defining if TE failed.
         db: MongoDB client.
         _mounts_cache: Cache for volume mounts.
+        _job_template: Cache for the per-task executor job skeleton.
     """
 
     def __init__(
@@ -71,11 +92,17 @@ class Texam:
         """
         self.task = task
         self.task_id = task.id
-        self.kubernetes_client = KubernetesAdapter()
-        self.message_broker = RedisMessageBroker()
+        self.kubernetes_client = get_kubernetes_client()
+        self.message_broker = get_redis_message_broker()
         self.failed = False
-        self.db = MongoDBClient()
+        self.db = get_mongo_client()
         self._mounts_cache: list[V1VolumeMount] | None = None
+        self._job_template: V1Job | None = None
+        # Frequently interpolated constants, bound once so per-executor paths
+        # skip the repeated attribute-chain lookups.
+        self._te_prefix = core_constants.K8s.TE_PREFIX
+        self._texam_prefix = core_constants.K8s.TEXAM_PREFIX
+        self._pvc_volume_name = core_constants.K8s.COMMON_PVC_VOLUME_NAME
 
     async def execute(self) -> None:
         """Execute TExAM.
@@ -83,60 +110,81 @@ class Texam:
         Creates individual k8s Jobs for each executor sequentially.
         If any executor fails, remaining executors are marked as failed.
         """
+        assert self.task_id is not None
+        executor_names = [
+            f"{self._te_prefix}-{self.task_id}-{idx}"
+            for idx in range(len(self.task.executors))
+        ]
         for idx, executor in enumerate(self.task.executors):
             if self.failed:
                 # If previous executor failed, mark remaining executors as failed
-                executor_name = f"{core_constants.K8s.TE_PREFIX}-{self.task_id}-{idx}"
-                if self.task_id is not None:
-                    await self.db.add_task_executor_log(self.task_id)
-                await self.db.update_executor_log(
-                    executor_name,
-                    PodPhase.FAILED.value,
-                    stdout="",
-                    stderr=(
-                        f"Executor {idx} failed to start because previous executor"
-                        " failed."
-                    ),
+                await self._mark_executor_failed(
+                    executor_names[idx],
+                    f"Executor {idx} failed to start because previous executor failed.",
                 )
                 continue
 
             # Create and monitor executor sequentially
-            success = await self.run_single_executor(executor, idx)
+            success = await self.run_single_executor(executor, idx, executor_names[idx])
             if not success:
                 self.failed = True
-                # Mark remaining executors as failed
-                for remaining_idx in range(idx + 1, len(self.task.executors)):
-                    remaining_executor_name = (
-                        f"{core_constants.K8s.TE_PREFIX}-{self.task_id}-{remaining_idx}"
+                # Mark remaining executors as failed. Push all the blank log
+                # entries in one write first: the index-addressed updates
+                # below assume their slots already exist, and interleaving
+                # pushes with $set could materialize elements out of order.
+                remaining = range(idx + 1, len(self.task.executors))
+                if remaining:
+                    await self.db.add_task_executor_log(
+                        self.task_id, count=len(remaining)
                     )
-                    if self.task_id is not None:
-                        await self.db.add_task_executor_log(self.task_id)
-                    await self.db.update_executor_log(
-                        remaining_executor_name,
-                        PodPhase.FAILED.value,
-                        stdout="",
-                        stderr=(
-                            f"Executor {remaining_idx} failed to start because"
-                            f" executor {idx} failed."
-                        ),
+                    await asyncio.gather(
+                        *(
+                            self.db.update_executor_log(
+                                executor_names[remaining_idx],
+                                PodPhase.FAILED.value,
+                                stdout="",
+                                stderr=f"Executor {remaining_idx} failed to start"
+                                f" because executor {idx} failed.",
+                            )
+                            for remaining_idx in remaining
+                        )
                     )
                 break
 
         await self.message()
 
-    async def run_single_executor(self, executor: TesExecutor, idx: int) -> bool:
+    async def _mark_executor_failed(self, executor_name: str, stderr: str) -> None:
+        """Record an executor that never started as failed in the task log.
+
+        Args:
+            executor_name: Name of the executor job.
+            stderr: Reason the executor did not start.
+        """
+        if self.task_id is not None:
+            await self.db.add_task_executor_log(self.task_id)
+        await self.db.update_executor_log(
+            executor_name,
+            PodPhase.FAILED.value,
+            stdout="",
+            stderr=stderr,
+        )
+
+    async def run_single_executor(
+        self, executor: TesExecutor, idx: int, executor_name: str
+    ) -> bool:
         """Run a single executor and monitor it to completion.
 
         Args:
             executor: Executor object.
             idx: Index of the executor.
+            executor_name: Precomputed name of the executor job.
 
         Returns:
             True if executor completed successfully, False otherwise.
         """
         # Create the executor job
-        job_created = await self.create_executor_job(executor, idx)
-        return await self.monitor_executor_job(executor, idx) if job_created else False
+        job_created = await self.create_executor_job(executor, executor_name)
+        return await self.monitor_executor_job(executor_name) if job_created else False
 
     def _build_command_string(self, executor: TesExecutor) -> str:
         """Constructs a shell command string.
@@ -147,21 +195,19 @@ class Texam:
         Args:
             executor: Executor object.
         """
-        command_str = " ".join(shlex.quote(arg) for arg in executor.command)
+        command_str = " ".join(_quote(arg) for arg in executor.command)
 
         # Handle stdin redirection from a file
         if executor.stdin:
-            command_str = f"{command_str} < {shlex.quote(executor.stdin)}"
+            command_str = f"{command_str} < {_quote(executor.stdin)}"
 
         # Handle stdout and stderr redirection
         if executor.stdout and executor.stderr:
-            command_str += (
-                f" > {shlex.quote(executor.stdout)} 2> {shlex.quote(executor.stderr)}"
-            )
+            command_str += f" > {_quote(executor.stdout)} 2> {_quote(executor.stderr)}"
         elif executor.stdout:
-            command_str += f" > {shlex.quote(executor.stdout)}"
+            command_str += f" > {_quote(executor.stdout)}"
         elif executor.stderr:
-            command_str += f" 2> {shlex.quote(executor.stderr)}"
+            command_str += f" 2> {_quote(executor.stderr)}"
 
         # Ignore errors if required
         if executor.ignore_error:
@@ -169,18 +215,19 @@ class Texam:
 
         return command_str
 
-    async def create_executor_job(self, executor: TesExecutor, idx: int) -> bool:
+    async def create_executor_job(
+        self, executor: TesExecutor, executor_name: str
+    ) -> bool:
         """Create a k8s Job for the executor.
 
         Args:
             executor: Executor object.
-            idx: Index of the executor.
+            executor_name: Precomputed name of the executor job.
 
         Returns:
             True if job was created successfully, False otherwise.
         """
-        executor_name = f"{core_constants.K8s.TE_PREFIX}-{self.task_id}-{idx}"
-        job_manifest = self._create_executor_job_manifest(executor, idx)
+        job_manifest = self._create_executor_job_manifest(executor, executor_name)
 
         backoff_time = 1
         while backoff_time < core_constants.Texam.BACKOFF_LIMIT:
@@ -198,16 +245,25 @@ class Texam:
                 await self.kubernetes_client.create_job(job_manifest)
                 await self.db.add_task_executor_log(self.task_id)
                 return True
+            except ApiException as e:
+                logger.error(f"Failed to create job {executor_name}: {e}")
+                if e.status == HTTPStatus.CONFLICT:
+                    # A previous attempt (partially) created the job, delete it
+                    # so the retried create doesn't keep conflicting. Transient
+                    # failures (e.g. throttling) skip this extra API call.
+                    logger.info(f"Deleting conflicting job {executor_name}")
+                    await self.kubernetes_client.delete_job(executor_name)
             except Exception as e:
                 logger.error(f"Failed to create job {executor_name}: {e}")
-                logger.info(f"Deleting job {executor_name}")
-                await self.kubernetes_client.delete_job(executor_name)
-                # We don't need to delete the executor log from the DB,
-                # since it isn't added until after the job is created.
-                # If TExAM has launched successfully, the DB is clearly functional.
-                logger.info(f"Retrying in {backoff_time} seconds")
-                await asyncio.sleep(backoff_time)
-                backoff_time = min(backoff_time * 2, core_constants.Texam.BACKOFF_LIMIT)
+            # We don't need to delete the executor log from the DB,
+            # since it isn't added until after the job is created.
+            # If TExAM has launched successfully, the DB is clearly functional.
+            # Jitter spreads out retries so concurrent executors don't hammer
+            # the API server in lockstep.
+            delay = backoff_time + random.uniform(0, 1)
+            logger.info(f"Retrying in {delay:.1f} seconds")
+            await asyncio.sleep(delay)
+            backoff_time = min(backoff_time * 2, core_constants.Texam.BACKOFF_LIMIT)
 
         # After all retries failed, log the failure and mark run as failed so
         # all executors can be marked as failed.
@@ -221,13 +277,28 @@ class Texam:
         return False
 
     def _is_covered(self, path: str, mounted_set: set) -> bool:
-        """Check if any mounted path is a prefix of this path."""
-        parts = Path(path).parts
-        for i in range(1, len(parts) + 1):
-            prefix = Path(*parts[:i])
-            if str(prefix) in mounted_set:
+        """Check if any mounted path is a prefix of this path.
+
+        Pure string walk from the path up through its ancestors; container
+        paths are POSIX strings, so there is no need to allocate a Path
+        object per prefix level.
+        """
+        candidate = path.rstrip("/") or "/"
+        while True:
+            if candidate in mounted_set:
                 return True
-        return False
+            if candidate == "/" or "/" not in candidate:
+                return False
+            candidate = candidate.rsplit("/", 1)[0] or "/"
+
+    @staticmethod
+    def _parent_dir(path: str) -> str:
+        """Return the parent directory of a POSIX path string.
+
+        String rpartition replaces the Path round-trip; container paths
+        never need platform-specific handling.
+        """
+        return path.rstrip("/").rpartition("/")[0] or "/"
 
     def _get_mounts(
         self,
@@ -245,7 +316,7 @@ class Texam:
         output_dirs = set()
         for o in self.task.outputs or []:
             if str(o.type) == str(TesFileType.FILE):
-                output_dirs.add(str(Path(o.path).parent))
+                output_dirs.add(self._parent_dir(o.path))
             else:
                 output_dirs.add(o.path)
 
@@ -264,10 +335,8 @@ class Texam:
             if str(inp.type) == str(TesFileType.DIRECTORY):
                 mount_target = inp_path
             else:
-                parent_path = Path(inp_path).parent
-                mount_target = (
-                    inp_path if parent_path == parent_path.root else str(parent_path)
-                )
+                parent_path = self._parent_dir(inp_path)
+                mount_target = inp_path if parent_path == "/" else parent_path
 
             if not self._is_covered(mount_target, volume_mounts | output_mounts):
                 input_mounts.add(
@@ -276,30 +345,33 @@ class Texam:
                     else inp_path
                 )
 
-        # Combine all
-        final_mounts = volume_mounts | output_mounts | input_mounts
-        self._mounts_cache = [
-            V1VolumeMount(
-                name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
-                mount_path=p,
-                sub_path=p.strip("/"),
+        # Combine all, keyed on mount_path. Deduplicating on the path string
+        # is O(N) and never compares full V1VolumeMount objects; a duplicate
+        # mount path would make K8s reject the pod with a 422.
+        mounts: dict[str, V1VolumeMount] = {}
+        for p in sorted(volume_mounts | output_mounts | input_mounts):
+            mounts.setdefault(
+                p,
+                V1VolumeMount(
+                    name=self._pvc_volume_name,
+                    mount_path=p,
+                    sub_path=p.strip("/"),
+                ),
             )
-            for p in sorted(final_mounts)
-        ]
+        self._mounts_cache = list(mounts.values())
 
         logger.debug(f"Mounts: {[m.to_dict() for m in self._mounts_cache]}")
 
         return self._mounts_cache
 
-    def _create_executor_job_manifest(self, executor: TesExecutor, idx: int) -> V1Job:
-        """Create a k8s Job for the executor.
+    def _build_job_template(self) -> V1Job:
+        """Build the per-task skeleton of the executor job manifest.
 
-        Args:
-            executor: Executor object.
-            idx: Index of the executor.
+        Everything that is identical across executors (resources, mounts,
+        volumes, security contexts) is built once here; the fields that vary
+        per executor (names, labels, image, command, env, workdir) are patched
+        on a deep copy by `_create_executor_job_manifest`.
         """
-        executor_name = f"{core_constants.K8s.TE_PREFIX}-{self.task_id}-{idx}"
-
         _resource = (
             {
                 "cpu": str(self.task.resources.cpu_cores)
@@ -316,23 +388,10 @@ class Texam:
             {k: v for k, v in _resource.items() if v is not None} if _resource else {}
         )
 
-        if self.task_id is None:
-            raise ValueError(f"task_id cannot be None for executor '{executor_name}'")
-
-        _parent = f"{core_constants.K8s.TEXAM_PREFIX}-{self.task_id}"
-
         return V1Job(
             api_version="batch/v1",
             kind="Job",
-            metadata=V1ObjectMeta(
-                name=executor_name,
-                labels=get_labels(
-                    component=core_constants.K8s.TE_PREFIX,
-                    task_id=self.task_id,
-                    name=executor_name,
-                    parent=f"{core_constants.K8s.TEXAM_PREFIX}-{self.task_id}",
-                ),
-            ),
+            metadata=V1ObjectMeta(),
             spec=V1JobSpec(
                 # Note: Backoff limit is set to 0 to fail immediately when pod fails.
                 #   This is because we want to fail all subsequent executors if any
@@ -344,31 +403,14 @@ class Texam:
                     else None
                 ),
                 template=V1PodTemplateSpec(
-                    metadata=V1ObjectMeta(
-                        labels=get_labels(
-                            component=core_constants.K8s.TE_PREFIX,
-                            task_id=self.task_id,
-                            name=executor_name,
-                            parent=f"{core_constants.K8s.TEXAM_PREFIX}-{self.task_id}",
-                        )
-                    ),
+                    metadata=V1ObjectMeta(),
                     spec=V1PodSpec(
                         security_context=get_executor_pod_security_context(),
                         containers=[
                             V1Container(
-                                name=executor_name,
-                                image=executor.image,
+                                name="executor",
+                                image=None,
                                 command=["/bin/sh", "-c"],
-                                args=[self._build_command_string(executor)],
-                                working_dir=executor.workdir,
-                                env=(
-                                    [
-                                        V1EnvVar(name=key, value=value)
-                                        for key, value in executor.env.items()
-                                    ]
-                                    if executor.env is not None
-                                    else []
-                                ),
                                 resources=V1ResourceRequirements(
                                     limits=resource,
                                     requests=resource,
@@ -380,7 +422,7 @@ class Texam:
                         ],
                         volumes=[
                             V1Volume(
-                                name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
+                                name=self._pvc_volume_name,
                                 persistent_volume_claim=V1PersistentVolumeClaimVolumeSource(
                                     claim_name=f"{core_constants.K8s.PVC_PREFIX}-{self.task_id}"
                                 ),
@@ -393,18 +435,57 @@ class Texam:
             ),
         )
 
-    async def monitor_executor_job(self, executor: TesExecutor, idx: int) -> bool:
-        """Monitor the executor job and log details in TaskDB.
+    def _create_executor_job_manifest(
+        self, executor: TesExecutor, executor_name: str
+    ) -> V1Job:
+        """Create a k8s Job for the executor.
+
+        The per-task skeleton is built once and cached; only the fields that
+        differ between executors are patched on a deep copy, which avoids
+        rebuilding the whole manifest tree for every executor.
 
         Args:
             executor: Executor object.
-            idx: Index of the executor.
+            executor_name: Precomputed name of the executor job.
+        """
+        if self.task_id is None:
+            raise ValueError(f"task_id cannot be None for executor '{executor_name}'")
+
+        if self._job_template is None:
+            self._job_template = self._build_job_template()
+
+        labels = get_labels(
+            component=self._te_prefix,
+            task_id=self.task_id,
+            name=executor_name,
+            parent=f"{self._texam_prefix}-{self.task_id}",
+        )
+
+        job = copy.deepcopy(self._job_template)
+        job.metadata.name = executor_name
+        job.metadata.labels = labels
+        job.spec.template.metadata.labels = labels
+        container = job.spec.template.spec.containers[0]
+        container.name = executor_name
+        container.image = executor.image
+        container.args = [self._build_command_string(executor)]
+        container.working_dir = executor.workdir
+        container.env = (
+            [V1EnvVar(name=key, value=value) for key, value in executor.env.items()]
+            if executor.env is not None
+            else []
+        )
+        return job
+
+    async def monitor_executor_job(self, executor_name: str) -> bool:
+        """Monitor the executor job and log details in TaskDB.
+
+        Args:
+            executor_name: Precomputed name of the executor job.
 
         Returns:
             True if executor completed successfully, False otherwise.
         """
-        executor_name = f"{core_constants.K8s.TE_PREFIX}-{self.task_id}-{idx}"
-
         timeout = int(
             os.getenv(
                 "MONITOR_TIMEOUT_SECONDS", core_constants.Texam.MONITOR_TIMEOUT_SECONDS
@@ -412,66 +493,32 @@ class Texam:
         )
 
         try:
-            w = watch.Watch()
-            logger.info(f"Starting watch for job: {executor_name}")
-
-            # Watch for job completion
-            for event in w.stream(
-                self.kubernetes_client.batch_api.list_namespaced_job,
-                namespace=self.kubernetes_client.namespace,
-                field_selector=f"metadata.name={executor_name}",
-                timeout_seconds=timeout,
-            ):
-                if not isinstance(event, dict):
-                    continue
-
-                job = event["object"]
-
-                if job.metadata.name != executor_name:
-                    continue
-
-                # Check job status
-                if job.status and job.status.conditions:
-                    for condition in job.status.conditions:
-                        if condition.type == "Complete" and condition.status == "True":
-                            # Job completed successfully
-                            logs = await self._get_job_logs(executor_name)
-                            await self.db.update_executor_log(
-                                executor_name,
-                                PodPhase.SUCCEEDED.value,
-                                stdout=logs[0],
-                                stderr=logs[1],
-                            )
-                            logger.info(f"Job {executor_name} completed successfully")
-                            w.stop()
-                            return True
-                        elif condition.type == "Failed" and condition.status == "True":
-                            # Job failed
-                            logs = await self._get_job_logs(executor_name)
-                            await self.db.update_executor_log(
-                                executor_name,
-                                PodPhase.FAILED.value,
-                                stdout=logs[0],
-                                stderr=logs[1],
-                            )
-                            logger.error(
-                                f"Job {executor_name} failed: {condition.message}"
-                            )
-                            w.stop()
-                            return False
-
-            # If we reach here, the timeout was reached
-            logger.error(
-                f"Job {executor_name} monitoring timed out after {timeout} seconds"
-            )
-            await self.db.update_executor_log(
-                executor_name,
-                PodPhase.FAILED.value,
-                stdout="",
-                stderr=f"Job monitoring timed out after {timeout} seconds.",
+            # Written by the watch thread, read once the watch task finishes.
+            # None means the watch ended without a terminal condition, ie.
+            # timeout.
+            outcome: dict[str, bool | str | None] = {"succeeded": None}
+
+            # Run the blocking watch stream in a worker thread, so the event
+            # loop stays free for DB and log work of other coroutines instead
+            # of being pinned by the stream. Stream the pod log concurrently
+            # so the body is already in hand when the job terminates instead
+            # of being fetched in one shot.
+            watch_task = asyncio.create_task(
+                asyncio.to_thread(self._watch_job, executor_name, timeout, outcome)
             )
-            w.stop()
-            return False
+            log_task = asyncio.create_task(self._stream_job_logs(executor_name))
+            try:
+                return await self._handle_job_outcome(
+                    executor_name, watch_task, log_task, outcome, timeout
+                )
+            finally:
+                # Reap the log follower on every exit, including watch
+                # errors; otherwise it outlives the monitor and is
+                # destroyed while still pending. Cancellation closes the
+                # underlying log response, so the worker thread unblocks.
+                log_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await log_task
 
         except Exception as e:
             logger.exception(f"Error monitoring job {executor_name}: {e}")
@@ -483,6 +530,236 @@ class Texam:
             )
             return False
 
+    def _watch_job(
+        self,
+        executor_name: str,
+        timeout: int,
+        outcome: dict[str, bool | str | None],
+    ) -> None:
+        """Watch the executor job until it terminates; blocking.
+
+        Runs in a worker thread. Reconnects with a resourceVersion bookmark
+        instead of treating every stream end as a timeout; the apiserver is
+        free to close long watches early.
+
+        Args:
+            executor_name: Name of the executor job.
+            timeout: Overall deadline in seconds, 0 to watch forever.
+            outcome: Terminal condition, written when the job completes or
+                fails and left untouched on timeout.
+        """
+        w = watch.Watch()
+        logger.info(f"Starting watch for job: {executor_name}")
+        last_rv: str | None = None
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            remaining = timeout or None
+            if deadline is not None:
+                remaining = int(deadline - time.monotonic())
+                if remaining <= 0:
+                    w.stop()
+                    return
+            try:
+                last_rv = self._consume_watch_stream(
+                    w, executor_name, last_rv, remaining, outcome
+                )
+            except ApiException as e:
+                if e.status == HTTPStatus.GONE:
+                    # Bookmark expired, relist from the latest state on
+                    # reconnect.
+                    last_rv = None
+                    continue
+                raise
+            if outcome["succeeded"] is not None:
+                return
+            if deadline is None:
+                # No timeout configured; the stream ended without a terminal
+                # condition, so reconnect and resume from the last seen
+                # resourceVersion.
+                logger.debug(f"Watch for {executor_name} ended, reconnecting")
+
+    def _consume_watch_stream(
+        self,
+        w: watch.Watch,
+        executor_name: str,
+        last_rv: str | None,
+        remaining: int | None,
+        outcome: dict[str, bool | str | None],
+    ) -> str | None:
+        """Consume one watch stream until a terminal condition or stream end.
+
+        Args:
+            w: The watch driving the stream.
+            executor_name: Name of the executor job.
+            last_rv: resourceVersion to resume from, None to relist.
+            remaining: Server-side timeout for this stream, in seconds.
+            outcome: Terminal condition, written when one is seen.
+
+        Returns:
+            The last seen resourceVersion, for the next reconnect.
+        """
+        for event in w.stream(
+            self.kubernetes_client.batch_api.list_namespaced_job,
+            namespace=self.kubernetes_client.namespace,
+            field_selector=f"metadata.name={executor_name}",
+            timeout_seconds=remaining,
+            allow_watch_bookmarks=True,
+            resource_version=last_rv,
+        ):
+            if not isinstance(event, dict):
+                continue
+
+            job = event["object"]
+
+            if job.metadata and job.metadata.resource_version:
+                last_rv = job.metadata.resource_version
+
+            if event.get("type") == "BOOKMARK":
+                continue
+
+            if job.metadata.name != executor_name:
+                continue
+
+            if self._record_terminal_condition(job, outcome):
+                w.stop()
+                return last_rv
+        return last_rv
+
+    @staticmethod
+    def _record_terminal_condition(
+        job: V1Job, outcome: dict[str, bool | str | None]
+    ) -> bool:
+        """Record the job's terminal condition in the outcome, if any.
+
+        Args:
+            job: The job object from the watch event.
+            outcome: Terminal condition, written when one is found.
+
+        Returns:
+            True if the job reached a terminal condition.
+        """
+        if not (job.status and job.status.conditions):
+            return False
+        for condition in job.status.conditions:
+            if condition.type == "Complete" and condition.status == "True":
+                outcome["succeeded"] = True
+                return True
+            if condition.type == "Failed" and condition.status == "True":
+                outcome["succeeded"] = False
+                outcome["message"] = condition.message
+                return True
+        return False
+
+    async def _handle_job_outcome(
+        self,
+        executor_name: str,
+        watch_task: asyncio.Task[None],
+        log_task: asyncio.Task[str],
+        outcome: dict[str, bool | str | None],
+        timeout: int,
+    ) -> bool:
+        """Wait for the watch to finish and record the executor's outcome.
+
+        Args:
+            executor_name: Name of the executor job.
+            watch_task: Task running the blocking watch stream.
+            log_task: Task following the pod log.
+            outcome: Terminal condition written by the watch thread.
+            timeout: Configured monitoring timeout, for the failure message.
+
+        Returns:
+            True if the executor completed successfully, False otherwise.
+        """
+        await watch_task
+
+        if outcome["succeeded"] is not None:
+            logs = await self._drain_job_logs(log_task, executor_name)
+            succeeded = bool(outcome["succeeded"])
+            # The TTL controller can lag (or no-op on older clusters), so
+            # delete the finished job explicitly; background propagation
+            # garbage-collects the pod without blocking the monitor. The
+            # deletion and the executor-log write touch different systems
+            # (K8s API vs Mongo), so they run concurrently.
+            await asyncio.gather(
+                self.kubernetes_client.delete_job(
+                    executor_name, propagation_policy="Background"
+                ),
+                self.db.update_executor_log(
+                    executor_name,
+                    PodPhase.SUCCEEDED.value if succeeded else PodPhase.FAILED.value,
+                    stdout=logs[0],
+                    stderr=logs[1],
+                ),
+            )
+            if succeeded:
+                logger.info(f"Job {executor_name} completed successfully")
+                return True
+            logger.error(f"Job {executor_name} failed: {outcome.get('message')}")
+            return False
+
+        # The watch ended without a terminal condition: timeout.
+        logger.error(
+            f"Job {executor_name} monitoring timed out after {timeout} seconds"
+        )
+        await self.db.update_executor_log(
+            executor_name,
+            PodPhase.FAILED.value,
+            stdout="",
+            stderr=f"Job monitoring timed out after {timeout} seconds.",
+        )
+        return False
+
+    async def _stream_job_logs(self, job_name: str) -> str:
+        """Follow the log of the job's pod while it runs.
+
+        Waits for the pod to show up, then streams its log incrementally so
+        the body is already collected when the job terminates.
+
+        Args:
+            job_name: Name of the job.
+
+        Returns:
+            The streamed pod log.
+        """
+        pod_name = None
+        while pod_name is None:
+            pods = await self.kubernetes_client.list_pods_by_label(
+                f"job-name={job_name}"
+            )
+            if pods and pods[0].metadata and pods[0].metadata.name:
+                pod_name = pods[0].metadata.name
+            else:
+                await asyncio.sleep(1)
+
+        while True:
+            try:
+                return await self.kubernetes_client.stream_pod_log(pod_name)
+            except ApiException as e:
+                if e.status == HTTPStatus.BAD_REQUEST:
+                    # The container hasn't started yet, try again shortly.
+                    await asyncio.sleep(1)
+                    continue
+                raise
+
+    async def _drain_job_logs(
+        self, log_task: asyncio.Task[str], job_name: str
+    ) -> tuple[str, str]:
+        """Collect the streamed log, falling back to a one-shot fetch.
+
+        Args:
+            log_task: The concurrent log-streaming task.
+            job_name: Name of the job.
+
+        Returns:
+            Tuple of stdout and stderr logs.
+        """
+        try:
+            return await asyncio.wait_for(log_task, timeout=10), ""
+        except Exception as e:
+            logger.warning(f"Streaming logs for job {job_name} failed: {e}")
+            log_task.cancel()
+            return await self._get_job_logs(job_name)
+
     async def _get_job_logs(self, job_name: str) -> tuple[str, str]:
         """Get logs from the job's pod.
 
@@ -498,14 +775,13 @@ class Texam:
         for attempt in range(max_retries):
             try:
                 # Get pods for this job using the job-name label
-                pods = self.kubernetes_client.core_api.list_namespaced_pod(
-                    namespace=self.kubernetes_client.namespace,
-                    label_selector=f"job-name={job_name}",
+                pods = await self.kubernetes_client.list_pods_by_label(
+                    f"job-name={job_name}"
                 )
 
-                if pods.items:
+                if pods:
                     # Get logs from the first pod (jobs typically create one pod)
-                    pod = pods.items[0]
+                    pod = pods[0]
                     if pod.metadata and pod.metadata.name:
                         pod_name = pod.metadata.name
                         logger.debug(
@@ -564,16 +840,22 @@ class Texam:
         return "", f"Internal error while getting logs for executor {job_name}."
 
     async def message(self) -> None:
-        """Send message to TORC."""
+        """Send message to TORC.
+
+        Publishes on the TExAM stage channel (the Texam job name) so TORC's
+        wait for this stage can't be satisfied by a filer's message on the
+        same task.
+        """
         assert self.task_id is not None
+        channel = f"{self._texam_prefix}-{self.task_id}"
         if not self.failed:
             self.message_broker.publish(
-                self.task_id,
+                channel,
                 Message(f"TExAM job for {self.task_id} has been completed."),
             )
         else:
             self.message_broker.publish(
-                self.task_id,
+                channel,
                 Message(
                     message="TExAM job failed to run all jobs successfully.",
                     status=MessageStatus.ERROR,
@@ -1,6 +1,10 @@
 """Task orchestrator (Torc)."""
 
+import asyncio
+import copy
 import logging
+import random
+from functools import lru_cache
 
 from kubernetes.client import (
     V1ObjectMeta,
@@ -10,23 +14,44 @@ from kubernetes.client import (
 )
 
 from poiesis.api.tes.models import (
-    TesInput,
-    TesOutput,
     TesState,
     TesTask,
 )
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
+from poiesis.core.adaptors.kubernetes.kubernetes import get_kubernetes_client
 from poiesis.core.constants import get_labels, get_poiesis_core_constants
+from poiesis.core.services.torc.torc_execution_template import TorcExecutionTemplate
 from poiesis.core.services.torc.torc_texam_execution import TorcTexamExecution
 from poiesis.core.services.torc.torc_tif_execution import TorcTifExecution
 from poiesis.core.services.torc.torc_tof_execution import TorcTofExecution
-from poiesis.repository.mongo import MongoDBClient
+from poiesis.repository.mongo import get_mongo_client
 
 logger = logging.getLogger(__name__)
 
 core_constants = get_poiesis_core_constants()
 
 
+@lru_cache
+def _get_pvc_template() -> V1PersistentVolumeClaim:
+    """Return the shared PVC skeleton with all task-independent fields set.
+
+    Built once per process; ``create_pvc`` deep-copies it and patches in the
+    task-specific name, labels and storage size instead of re-wrapping the
+    nested client models for every task.
+    """
+    return V1PersistentVolumeClaim(
+        api_version="v1",
+        kind="PersistentVolumeClaim",
+        metadata=V1ObjectMeta(),
+        spec=V1PersistentVolumeClaimSpec(
+            access_modes=[core_constants.K8s.PVC_ACCESS_MODE]
+            if core_constants.K8s.PVC_ACCESS_MODE
+            else None,
+            storage_class_name=core_constants.K8s.PVC_STORAGE_CLASS or None,
+            resources=V1ResourceRequirements(requests={}),
+        ),
+    )
+
+
 class Torc:
     """Torc service.
 
@@ -54,10 +79,10 @@ class Torc:
         if task.id is None:
             raise ValueError("Task ID is required")
         self.id = task.id
-        self.kubernetes_client = KubernetesAdapter()
-        self.db = MongoDBClient()
+        self.kubernetes_client = get_kubernetes_client()
+        self.db = get_mongo_client()
         self.pvc_name = ""
-        logger.info(f"Torc initialized with task ID: {self.id}")
+        logger.info("Torc initialized with task ID: %s", self.id)
 
     async def execute(self) -> None:
         """Defines the template method, for each service namely Texam, Tif, Tof."""
@@ -65,47 +90,98 @@ class Torc:
         disk_gb = None
         if self.task.resources is not None:
             disk_gb = self.task.resources.disk_gb
-            logger.debug(f"Task {self.id} requested disk size: {disk_gb}GB")
-
-        assert self.id is not None  # Already checked in execute()
+            logger.debug("Task %s requested disk size: %sGB", self.id, disk_gb)
 
         try:
-            # Create PVC
-            logger.info(f"Task {self.id}: Creating PVC")
-            await self.create_pvc(self.id, disk_gb)
-
-            # Update task state
-            logger.info(f"Task {self.id}: Updating task state to RUNNING")
-            await self.db.update_task_state(self.id, TesState.RUNNING)
-            await self.db.add_task_log(self.id)
-
-            # Execute pipeline stages
-            logger.info(f"Task {self.id}: Starting TIF execution")
-            await self.tif_execution(self.id, self.task.inputs)
-
-            logger.info(f"Task {self.id}: Starting TExAM execution")
-            await self.texam_execution(self.task)
+            # Create PVC and update task state concurrently. PVC binding and
+            # the initial DB writes are independent, so the DB round-trips are
+            # hidden behind the PVC API call.
+            logger.info("Task %s: Creating PVC and marking task as RUNNING", self.id)
+            # return_exceptions lets every write settle before any failure is
+            # handled; failing fast could let the RUNNING write land after the
+            # SYSTEM_ERROR one, leaving the task stuck in RUNNING.
+            results = await asyncio.gather(
+                self.create_pvc(self.id, disk_gb),
+                self.db.update_task_state(self.id, TesState.RUNNING),
+                self.db.add_task_log(self.id),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    await self._fail("task setup", result)
+                    raise result
+
+            # Execute pipeline stages; the filer stages are skipped
+            # entirely for tasks with no inputs/outputs.
+            if self.task.inputs:
+                await self._run_stage("TIF", TorcTifExecution(self.id))
+            else:
+                logger.info("Task %s has no inputs, skipping TIF execution", self.id)
+
+            await self._run_stage("TExAM", TorcTexamExecution(self.task))
+
+            if self.task.outputs:
+                await self._run_stage("TOF", TorcTofExecution(self.id))
+            else:
+                logger.info("Task %s has no outputs, skipping TOF execution", self.id)
+
+            # Kick off PVC deletion in the background; storage-class
+            # finalizers can take seconds, so teardown overlaps the final DB
+            # writes instead of blocking task completion at the end.
+            cleanup_task = asyncio.create_task(self._cleanup_pvc(self.pvc_name))
+
+            # If we get here, everything succeeded. System logs, log end time
+            # and the terminal state are flushed in one batched write.
+            logger.info("Task %s: Execution completed successfully", self.id)
+            await self.db.finalize_task(self.id, TesState.COMPLETE)
+
+            await cleanup_task
+        except Exception as e:
+            logger.error("Task %s: Execution failed: %s", self.id, e)
+            cleanup_task = asyncio.create_task(self._cleanup_pvc(self.pvc_name))
+            await self.db.finalize_task(self.id)
+            await cleanup_task
+            raise
 
-            logger.info(f"Task {self.id}: Starting TOF execution")
-            await self.tof_execution(self.id, self.task.outputs)
+    async def _cleanup_pvc(self, pvc_name: str) -> None:
+        """Delete the task PVC, retrying transient failures.
 
-            logger.info(f"Task {self.id}: Adding system logs")
-            await self.db.add_tes_task_system_logs(self.id)
-            await self.db.add_tes_task_log_end_time(self.id)
+        Runs as a background task so task completion isn't blocked on
+        storage-class teardown. Failures are logged, never raised.
 
-            # If we get here, everything succeeded
-            logger.info(f"Task {self.id}: Execution completed successfully")
-            await self.db.update_task_state(self.id, TesState.COMPLETE)
+        Args:
+            pvc_name: Name of the PVC to delete.
+        """
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                await self.kubernetes_client.delete_pvc(pvc_name)
+                logger.info("Task %s: PVC %s deleted successfully", self.id, pvc_name)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Task %s: Failed to delete PVC %s (attempt %d/%d): %s",
+                    self.id,
+                    pvc_name,
+                    attempt + 1,
+                    max_retries,
+                    e,
+                )
+                # Jitter keeps concurrent tasks from retrying in lockstep
+                # when the API server has a transient hiccup.
+                await asyncio.sleep(2**attempt + random.uniform(0, 1))
+        logger.error("Task %s: Giving up on deleting PVC %s", self.id, pvc_name)
+
+    async def _fail(self, stage: str, exc: BaseException) -> None:
+        """Log a stage failure and mark the task as SYSTEM_ERROR.
 
-            # Clean up PVC after successful completion
-            await self.kubernetes_client.delete_pvc(self.pvc_name)
-            logger.info(f"Task {self.id}: PVC {self.pvc_name} deleted successfully")
-        except Exception as e:
-            logger.error(f"Task {self.id}: Execution failed: {str(e)}")
-            await self.db.add_tes_task_system_logs(self.id)
-            await self.db.add_tes_task_log_end_time(self.id)
-            await self.kubernetes_client.delete_pvc(self.pvc_name)
-            raise
+        Args:
+            stage: Human-readable name of the failed stage.
+            exc: The exception that caused the failure.
+        """
+        logger.error("Failed to execute %s: %s", stage, exc)
+        logger.error("Updating task %s state to SYSTEM_ERROR", self.id)
+        await self.db.update_task_state(self.id, TesState.SYSTEM_ERROR)
 
     async def create_pvc(self, name: str, size: float | None) -> None:
         """Create a PVC for the task.
@@ -122,8 +198,8 @@ class Torc:
         """
         pvc_name = f"{core_constants.K8s.PVC_PREFIX}-{name}"
         logger.debug(
-            f"PVC storage size: {size}Gi if size else "
-            f"{core_constants.K8s.PVC_DEFAULT_DISK_SIZE}"
+            "PVC storage size: %s",
+            f"{size}Gi" if size else core_constants.K8s.PVC_DEFAULT_DISK_SIZE,
         )
 
         if (
@@ -133,134 +209,41 @@ class Torc:
             logger.warning(
                 "PVC access mode and storage class are not set. Using default values."
             )
-            logger.debug(f"PVC access mode: {core_constants.K8s.PVC_ACCESS_MODE}")
-            logger.debug(f"PVC storage class: {core_constants.K8s.PVC_STORAGE_CLASS}")
-
-        pvc = V1PersistentVolumeClaim(
-            api_version="v1",
-            kind="PersistentVolumeClaim",
-            metadata=V1ObjectMeta(
-                name=pvc_name,
-                labels=get_labels(
-                    component=core_constants.K8s.PVC_PREFIX,
-                    task_id=name,
-                    name=pvc_name,
-                    parent=f"{core_constants.K8s.TORC_PREFIX}-{name}",
-                ),
-            ),
-            spec=V1PersistentVolumeClaimSpec(
-                access_modes=[core_constants.K8s.PVC_ACCESS_MODE]
-                if core_constants.K8s.PVC_ACCESS_MODE
-                else None,
-                storage_class_name=core_constants.K8s.PVC_STORAGE_CLASS or None,
-                resources=V1ResourceRequirements(
-                    requests={
-                        "storage": f"{size}Gi"
-                        if size
-                        else core_constants.K8s.PVC_DEFAULT_DISK_SIZE
-                    }
-                ),
-            ),
+            logger.debug("PVC access mode: %s", core_constants.K8s.PVC_ACCESS_MODE)
+            logger.debug("PVC storage class: %s", core_constants.K8s.PVC_STORAGE_CLASS)
+
+        pvc = copy.deepcopy(_get_pvc_template())
+        pvc.metadata.name = pvc_name
+        pvc.metadata.labels = get_labels(
+            component=core_constants.K8s.PVC_PREFIX,
+            task_id=name,
+            name=pvc_name,
+            parent=f"{core_constants.K8s.TORC_PREFIX}-{name}",
         )
-        try:
-            self.pvc_name = await self.kubernetes_client.create_pvc(pvc)
-            logger.info(f"PVC created: {self.pvc_name}")
-        except Exception as e:
-            logger.error(f"Failed to create PVC: {str(e)}")
-            _id = str(self.id)  # This will be str as we are using uuid4
-            logger.error(f"Updating task {_id} state to SYSTEM_ERROR")
-            await self.db.update_task_state(_id, TesState.SYSTEM_ERROR)
-            raise
-
-    async def tif_execution(self, name: str, inputs: list[TesInput] | None) -> None:
-        """Execute the Tif job.
-
-        Args:
-            name: Name of the task, will be modified to create Tif job name.
-            inputs: List of inputs given in the task.
-            volumes: List of volumes given in the task.
-
-        Raises:
-            Exception: If the Tif job fails.
-        """
-        logger.info(f"Starting TIF execution for task {name}")
-        if inputs:
-            logger.debug(f"Task {name} has {len(inputs)} inputs")
-        else:
-            logger.debug(f"Task {name} has no inputs")
-
-        if inputs is None or len(inputs) == 0:
-            logger.info(f"Task {name} has no inputs, skipping TIF execution")
-            return
-
-        try:
-            tif_executor = TorcTifExecution(name, inputs)
-            await tif_executor.execute()
-            logger.info(f"TIF execution completed successfully for task {name}")
-        except Exception as e:
-            logger.error(f"Failed to execute Tif: {str(e)}")
-            _id = str(self.id)  # This will be str as we are using uuid4
-            logger.error(f"Updating task {_id} state to SYSTEM_ERROR")
-            await self.db.update_task_state(_id, TesState.SYSTEM_ERROR)
-            raise
-
-    async def texam_execution(
-        self,
-        task: TesTask,
-    ) -> None:
-        """Execute the Texam job.
-
-        Args:
-            task: The TES task that needs to be executed.
+        pvc.spec.resources.requests = {
+            "storage": f"{size}Gi" if size else core_constants.K8s.PVC_DEFAULT_DISK_SIZE
+        }
+        # Failures propagate to execute(), which marks the task
+        # SYSTEM_ERROR only after the concurrent setup writes have settled.
+        self.pvc_name = await self.kubernetes_client.create_pvc(pvc)
+        logger.info("PVC created: %s", self.pvc_name)
 
-        Raises:
-            Exception: If the Texam job fails.
-        """
-        logger.info(f"Starting TEXAM execution for task {task.id}")
-        try:
-            texam_executor = TorcTexamExecution(task)
-            await texam_executor.execute()
-            logger.info(f"TEXAM execution completed successfully for task {task.id}")
-        except Exception as e:
-            logger.error(f"Failed to execute Texam: {str(e)}")
-            logger.error(e)
-            _id = str(self.id)  # This will be str as we are using uuid4
-            logger.error(f"Updating task {_id} state to SYSTEM_ERROR")
-            await self.db.update_task_state(_id, TesState.SYSTEM_ERROR)
-            raise
-
-    async def tof_execution(
-        self,
-        name: str,
-        outputs: list[TesOutput] | None,
-    ) -> None:
-        """Execute the Tof job.
+    async def _run_stage(self, stage: str, executor: TorcExecutionTemplate) -> None:
+        """Run one pipeline stage, marking the task SYSTEM_ERROR on failure.
 
         Args:
-            name: Name of the task, will be modified to create Tof job name.
-            outputs: List of outputs given in the task.
+            stage: Human-readable name of the stage, used for logging.
+            executor: The stage's execution template.
 
         Raises:
-            Exception: If the Tof job fails.
+            Exception: Re-raised if the stage fails.
         """
-        logger.info(f"Starting TOF execution for task {name}")
-
-        if outputs:
-            logger.debug(f"Task {name} has {len(outputs)} outputs")
-        else:
-            logger.debug(f"Task {name} has no outputs")
-
-        if outputs is None or len(outputs) == 0:
-            logger.info(f"Task {name} has no outputs, skipping TOF execution")
-            return
-
+        logger.info("Starting %s execution for task %s", stage, self.id)
         try:
-            tof_executor = TorcTofExecution(name, outputs)
-            await tof_executor.execute()
-            logger.info(f"TOF execution completed successfully for task {name}")
+            await executor.execute()
+            logger.info(
+                "%s execution completed successfully for task %s", stage, self.id
+            )
         except Exception as e:
-            logger.error(f"Failed to execute Tof: {str(e)}")
-            _id = str(self.id)  # This will be str as we are using uuid4
-            logger.error(f"Updating task {_id} state to SYSTEM_ERROR")
-            await self.db.update_task_state(_id, TesState.SYSTEM_ERROR)
+            await self._fail(stage, e)
             raise
@@ -1,7 +1,9 @@
 """Torc's template for each service."""
 
+import copy
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from kubernetes.client import (
     V1ConfigMapKeySelector,
@@ -19,8 +21,10 @@ from kubernetes.client import (
 )
 from kubernetes.client.exceptions import ApiException
 
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
-from poiesis.core.adaptors.message_broker.redis_adaptor import RedisMessageBroker
+from poiesis.core.adaptors.kubernetes.kubernetes import get_kubernetes_client
+from poiesis.core.adaptors.message_broker.redis_adaptor import (
+    get_redis_message_broker,
+)
 from poiesis.core.constants import (
     get_configmap_names,
     get_infrastructure_container_security_context,
@@ -34,13 +38,81 @@ from poiesis.core.constants import (
     get_tes_task_request_volume_mounts,
 )
 from poiesis.core.ports.message_broker import Message, MessageStatus
-from poiesis.repository.mongo import MongoDBClient
+from poiesis.repository.mongo import get_mongo_client
 
 core_constants = get_poiesis_core_constants()
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def _get_filer_job_template() -> V1Job:
+    """Return the shared filer Job skeleton with all static fields set.
+
+    Everything that doesn't depend on the task — env, security contexts,
+    image, backoff/TTL — is rendered once per process; ``create_job`` deep-
+    copies the skeleton and patches in the per-task metadata, command and
+    PVC binding instead of re-running the whole nested constructor tree.
+    """
+    try:
+        ttl = int(core_constants.K8s.JOB_TTL) if core_constants.K8s.JOB_TTL else None
+    except (ValueError, TypeError):
+        logger.warning(
+            "Invalid JOB_TTL %s, falling back to no TTL (None).",
+            core_constants.K8s.JOB_TTL,
+        )
+        ttl = None
+    return V1Job(
+        api_version="batch/v1",
+        kind="Job",
+        spec=V1JobSpec(
+            backoff_limit=int(core_constants.K8s.BACKOFF_LIMIT),
+            template=V1PodTemplateSpec(
+                spec=V1PodSpec(
+                    security_context=get_infrastructure_pod_security_context(),
+                    containers=[
+                        V1Container(
+                            name="filer",
+                            image=core_constants.K8s.POIESIS_IMAGE,
+                            env=list(get_message_broker_envs())
+                            + list(get_mongo_envs())
+                            + list(get_s3_envs())
+                            + list(get_secret_names())
+                            + list(get_configmap_names())
+                            + [
+                                V1EnvVar(
+                                    name="POIESIS_IMAGE",
+                                    value=core_constants.K8s.POIESIS_IMAGE,
+                                ),
+                                V1EnvVar(
+                                    name="LOG_LEVEL",
+                                    value_from=V1EnvVarSource(
+                                        config_map_key_ref=V1ConfigMapKeySelector(
+                                            name=core_constants.K8s.CONFIGMAP_NAME,
+                                            key="LOG_LEVEL",
+                                        )
+                                    ),
+                                ),
+                            ],
+                            volume_mounts=[
+                                V1VolumeMount(
+                                    name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
+                                    mount_path=core_constants.K8s.FILER_PVC_PATH,
+                                )
+                            ]
+                            + get_tes_task_request_volume_mounts(),
+                            image_pull_policy=core_constants.K8s.IMAGE_PULL_POLICY,
+                            security_context=get_infrastructure_container_security_context(),
+                        ),
+                    ],
+                    restart_policy=core_constants.K8s.RESTART_POLICY,
+                ),
+            ),
+            ttl_seconds_after_finished=ttl,
+        ),
+    )
+
+
 class TorcExecutionTemplate(ABC):
     """TorcTemplate is a template class for the Torc service.
 
@@ -58,6 +130,17 @@ class TorcExecutionTemplate(ABC):
         """Task identifier - must be implemented by subclasses."""
         pass
 
+    @property
+    @abstractmethod
+    def channel(self) -> str:
+        """Broker channel this stage's job reports completion on.
+
+        Channels are scoped per stage (job name, e.g. ``po-tif-<task id>``)
+        so one stage's completion event can never satisfy another stage's
+        wait on the same task.
+        """
+        pass
+
     def __init__(self) -> None:
         """TorcTemplate initialization.
 
@@ -67,15 +150,15 @@ class TorcExecutionTemplate(ABC):
             message: Message for the message broker, which would be sent to TOrc.
             db: Database client.
         """
-        self.kubernetes_client = KubernetesAdapter()
-        self.message_broker = RedisMessageBroker()
+        self.kubernetes_client = get_kubernetes_client()
+        self.message_broker = get_redis_message_broker()
         self.message: Message | None = None
-        self.db = MongoDBClient()
+        self.db = get_mongo_client()
 
     async def execute(self) -> None:
         """Defines the template method, for each service namely Texam, Tif, Tof."""
         await self.start_job()
-        self.wait()
+        await self.wait()
         await self.log()
 
     async def create_job(
@@ -96,78 +179,21 @@ class TorcExecutionTemplate(ABC):
             args: The arguments to pass to the filer commands.
             metadata: The metadata for the job to be used in K8s manifest.
         """
-        try:
-            _ttl = (
-                int(core_constants.K8s.JOB_TTL) if core_constants.K8s.JOB_TTL else None
-            )
-        except (ValueError, TypeError):
-            logger.warning(
-                f"Invalid JOB_TTL {core_constants.K8s.JOB_TTL}, falling back to no TTL "
-                "(None).",
-            )
-            _ttl = None
-        job = V1Job(
-            api_version="batch/v1",
-            kind="Job",
-            metadata=metadata,
-            spec=V1JobSpec(
-                backoff_limit=int(core_constants.K8s.BACKOFF_LIMIT),
-                template=V1PodTemplateSpec(
-                    metadata=metadata,
-                    spec=V1PodSpec(
-                        security_context=get_infrastructure_pod_security_context(),
-                        containers=[
-                            V1Container(
-                                name=job_name,
-                                image=core_constants.K8s.POIESIS_IMAGE,
-                                command=commands,
-                                env=list(get_message_broker_envs())
-                                + list(get_mongo_envs())
-                                + list(get_s3_envs())
-                                + list(get_secret_names())
-                                + list(get_configmap_names())
-                                + [
-                                    V1EnvVar(
-                                        name="POIESIS_IMAGE",
-                                        value=core_constants.K8s.POIESIS_IMAGE,
-                                    ),
-                                    V1EnvVar(
-                                        name="LOG_LEVEL",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="LOG_LEVEL",
-                                            )
-                                        ),
-                                    ),
-                                ],
-                                volume_mounts=[
-                                    V1VolumeMount(
-                                        name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
-                                        mount_path=core_constants.K8s.FILER_PVC_PATH,
-                                    )
-                                ]
-                                + get_tes_task_request_volume_mounts(),
-                                image_pull_policy=core_constants.K8s.IMAGE_PULL_POLICY,
-                                security_context=get_infrastructure_container_security_context(),
-                            ),
-                        ],
-                        volumes=[
-                            V1Volume(
-                                name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
-                                persistent_volume_claim=V1PersistentVolumeClaimVolumeSource(
-                                    claim_name=f"{core_constants.K8s.PVC_PREFIX}-{task_id}"
-                                ),
-                            )
-                        ]
-                        + get_tes_task_request_volume(task_id),
-                        restart_policy=core_constants.K8s.RESTART_POLICY,
-                    ),
+        job = copy.deepcopy(_get_filer_job_template())
+        job.metadata = metadata
+        job.spec.template.metadata = metadata
+        container = job.spec.template.spec.containers[0]
+        container.name = job_name
+        container.command = commands
+        job.spec.template.spec.volumes = [
+            V1Volume(
+                name=core_constants.K8s.COMMON_PVC_VOLUME_NAME,
+                persistent_volume_claim=V1PersistentVolumeClaimVolumeSource(
+                    claim_name=f"{core_constants.K8s.PVC_PREFIX}-{task_id}"
                 ),
-                ttl_seconds_after_finished=_ttl,
-            ),
-        )
-        logger.debug(job)
+            )
+        ] + get_tes_task_request_volume(task_id)
+        logger.debug("Submitting job %s", job.metadata.name)
         try:
             await self.kubernetes_client.create_job(job)
         except ApiException as e:
@@ -182,19 +208,17 @@ class TorcExecutionTemplate(ABC):
         """
         pass
 
-    def wait(self) -> None:
+    async def wait(self) -> None:
         """Wait for the job to finish.
 
-        Uses message broker with task name as channel name
-        and waits on that channel for the message.
+        Waits on the stage's own channel, so completions from earlier
+        stages of the same task are never mistaken for this one. The
+        subscription is consumed natively on the event loop, so other
+        coroutines keep running for the whole duration of the job.
         """
-        message = None
-        for message in self.message_broker.subscribe(self.id):
-            if message:
-                if message.status == MessageStatus.ERROR:
-                    logger.error(message.message)
-                self.message = message
-                break
+        self.message = await self.message_broker.wait_for(self.channel)
+        if self.message and self.message.status == MessageStatus.ERROR:
+            logger.error(self.message.message)
 
     async def log(self) -> None:
         """Log the job status in TaskDB."""
@@ -1,6 +1,8 @@
 """Create Texam Job and monitor it."""
 
+import copy
 import logging
+from functools import lru_cache
 
 from kubernetes.client import (
     V1ConfigMapKeySelector,
@@ -31,12 +33,123 @@ from poiesis.core.constants import (
     get_tes_task_request_volume,
     get_tes_task_request_volume_mounts,
 )
+from poiesis.core.ports.message_broker import Message
 from poiesis.core.services.torc.torc_execution_template import TorcExecutionTemplate
 
 core_constants = get_poiesis_core_constants()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def _get_job_ttl() -> int | None:
+    """Parse the configured job TTL once per process.
+
+    Returns:
+        The TTL in seconds, or None when unset or unparseable.
+    """
+    try:
+        return int(core_constants.K8s.JOB_TTL) if core_constants.K8s.JOB_TTL else None
+    except (ValueError, TypeError):
+        logger.warning(
+            "Invalid JOB_TTL %s, falling back to no TTL (None).",
+            core_constants.K8s.JOB_TTL,
+        )
+        return None
+
+
+@lru_cache
+def _get_texam_env() -> tuple[V1EnvVar, ...]:
+    """Return the full env for the Texam container, built once per process.
+
+    Every entry is static configuration, so the tuple factories and the
+    literal V1EnvVar block are flattened a single time instead of being
+    re-materialized and concatenated on each start_job call.
+    """
+
+    def _from_configmap(name: str, key: str, optional: bool = False) -> V1EnvVar:
+        return V1EnvVar(
+            name=name,
+            value_from=V1EnvVarSource(
+                config_map_key_ref=V1ConfigMapKeySelector(
+                    name=core_constants.K8s.CONFIGMAP_NAME,
+                    key=key,
+                    optional=optional or None,
+                )
+            ),
+        )
+
+    # Values Torc is itself authoritative for are pushed as plain strings;
+    # only the user-tunable knobs keep a configMapKeyRef so edits apply
+    # without redeploying Torc. Plain values spare the kubelet a configmap
+    # lookup per entry and shrink every PodSpec.
+    return (
+        *get_mongo_envs(),
+        *get_message_broker_envs(),
+        *get_secret_names(),
+        *get_configmap_names(),
+        *get_security_context_envs(),
+        V1EnvVar(name="POIESIS_IMAGE", value=core_constants.K8s.POIESIS_IMAGE),
+        _from_configmap("LOG_LEVEL", "LOG_LEVEL"),
+        _from_configmap(
+            "MONITOR_TIMEOUT_SECONDS", "MONITOR_TIMEOUT_SECONDS", optional=True
+        ),
+        V1EnvVar(name="POIESIS_K8S_NAMESPACE", value=core_constants.K8s.K8S_NAMESPACE),
+        V1EnvVar(
+            name="POIESIS_SERVICE_ACCOUNT_NAME",
+            value=core_constants.K8s.SERVICE_ACCOUNT_NAME,
+        ),
+        V1EnvVar(
+            name="POIESIS_RESTART_POLICY", value=core_constants.K8s.RESTART_POLICY
+        ),
+        V1EnvVar(
+            name="POIESIS_IMAGE_PULL_POLICY",
+            value=core_constants.K8s.IMAGE_PULL_POLICY,
+        ),
+        *(
+            (V1EnvVar(name="POIESIS_JOB_TTL", value=core_constants.K8s.JOB_TTL),)
+            if core_constants.K8s.JOB_TTL
+            else ()
+        ),
+    )
+
+
+@lru_cache
+def _get_texam_job_template() -> V1Job:
+    """Return the shared Texam Job skeleton with all static fields set.
+
+    The service account, security contexts, container spec and env never
+    change between tasks, so the tree is rendered once per process;
+    ``start_job`` deep-copies it and patches in the metadata and the task's
+    request volume.
+    """
+    return V1Job(
+        api_version="batch/v1",
+        kind="Job",
+        spec=V1JobSpec(
+            template=V1PodTemplateSpec(
+                spec=V1PodSpec(
+                    service_account_name=core_constants.K8s.SERVICE_ACCOUNT_NAME,
+                    security_context=get_infrastructure_pod_security_context(),
+                    containers=[
+                        V1Container(
+                            name=core_constants.K8s.TIF_PREFIX,
+                            image=core_constants.K8s.POIESIS_IMAGE,
+                            command=["poiesis", "texam", "run"],
+                            image_pull_policy=core_constants.K8s.IMAGE_PULL_POLICY,
+                            security_context=get_infrastructure_container_security_context(),
+                            env=list(_get_texam_env()),
+                            volume_mounts=get_infrastructure_security_volume_mount()
+                            + get_tes_task_request_volume_mounts(),
+                        )
+                    ],
+                    restart_policy=core_constants.K8s.RESTART_POLICY,
+                ),
+            ),
+            ttl_seconds_after_finished=_get_job_ttl(),
+        ),
+    )
+
+
 class TorcTexamExecution(TorcExecutionTemplate):
     """Tif execution class.
 
@@ -80,139 +193,36 @@ class TorcTexamExecution(TorcExecutionTemplate):
             raise ValueError("Task ID is None")
         return self._task_id
 
+    @property
+    def channel(self) -> str:
+        """Return the stage-scoped channel, same as the Texam job name."""
+        return f"{core_constants.K8s.TEXAM_PREFIX}-{self.id}"
+
     async def start_job(self) -> None:
         """Create the K8s job for Texam."""
-        texam_name = f"{core_constants.K8s.TEXAM_PREFIX}-{self.id}"
-        try:
-            _ttl = (
-                int(core_constants.K8s.JOB_TTL) if core_constants.K8s.JOB_TTL else None
+        if not self.task.executors:
+            # Nothing to run; signal completion directly instead of paying
+            # for a pod that would just exit.
+            logger.info("Task %s has no executors, skipping Texam job", self.id)
+            self.message_broker.publish(
+                self.channel, Message("Texam skipped: no executors.")
             )
-        except (ValueError, TypeError):
-            logger.warning(
-                f"Invalid JOB_TTL {core_constants.K8s.JOB_TTL}, falling back to no TTL "
-                "(None).",
-            )
-            _ttl = None
-        job = V1Job(
-            api_version="batch/v1",
-            kind="Job",
-            metadata=V1ObjectMeta(
-                name=texam_name,
-                labels=get_labels(
-                    component=core_constants.K8s.TEXAM_PREFIX,
-                    task_id=self.id,
-                    name=texam_name,
-                    parent=f"{core_constants.K8s.TORC_PREFIX}-{self.id}",
-                ),
-            ),
-            spec=V1JobSpec(
-                template=V1PodTemplateSpec(
-                    metadata=V1ObjectMeta(
-                        labels=get_labels(
-                            component=core_constants.K8s.TEXAM_PREFIX,
-                            name=texam_name,
-                            task_id=self.id,
-                            parent=f"{core_constants.K8s.TORC_PREFIX}-{self.id}",
-                        ),
-                    ),
-                    spec=V1PodSpec(
-                        service_account_name=core_constants.K8s.SERVICE_ACCOUNT_NAME,
-                        security_context=get_infrastructure_pod_security_context(),
-                        containers=[
-                            V1Container(
-                                name=core_constants.K8s.TIF_PREFIX,
-                                image=core_constants.K8s.POIESIS_IMAGE,
-                                command=["poiesis", "texam", "run"],
-                                image_pull_policy=core_constants.K8s.IMAGE_PULL_POLICY,
-                                security_context=get_infrastructure_container_security_context(),
-                                env=list(get_mongo_envs())
-                                + list(get_message_broker_envs())
-                                + list(get_secret_names())
-                                + list(get_configmap_names())
-                                + list(get_security_context_envs())
-                                + [
-                                    V1EnvVar(
-                                        name="POIESIS_IMAGE",
-                                        value=core_constants.K8s.POIESIS_IMAGE,
-                                    ),
-                                    V1EnvVar(
-                                        name="LOG_LEVEL",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="LOG_LEVEL",
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="MONITOR_TIMEOUT_SECONDS",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="MONITOR_TIMEOUT_SECONDS",
-                                                optional=True,
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="POIESIS_K8S_NAMESPACE",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="POIESIS_K8S_NAMESPACE",
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="POIESIS_SERVICE_ACCOUNT_NAME",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="POIESIS_SERVICE_ACCOUNT_NAME",
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="POIESIS_RESTART_POLICY",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="POIESIS_RESTART_POLICY",
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="POIESIS_IMAGE_PULL_POLICY",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="POIESIS_IMAGE_PULL_POLICY",
-                                            )
-                                        ),
-                                    ),
-                                    V1EnvVar(
-                                        name="POIESIS_JOB_TTL",
-                                        value_from=V1EnvVarSource(
-                                            config_map_key_ref=V1ConfigMapKeySelector(
-                                                name=core_constants.K8s.CONFIGMAP_NAME,
-                                                key="POIESIS_JOB_TTL",
-                                            )
-                                        ),
-                                    ),
-                                ],
-                                volume_mounts=get_infrastructure_security_volume_mount()
-                                + get_tes_task_request_volume_mounts(),
-                            )
-                        ],
-                        restart_policy=core_constants.K8s.RESTART_POLICY,
-                        volumes=get_infrastructure_security_volume()
-                        + get_tes_task_request_volume(self.id),
-                    ),
-                ),
-                ttl_seconds_after_finished=_ttl,
-            ),
+            return
+        texam_name = f"{core_constants.K8s.TEXAM_PREFIX}-{self.id}"
+        parent_name = f"{core_constants.K8s.TORC_PREFIX}-{self.id}"
+        labels = get_labels(
+            component=core_constants.K8s.TEXAM_PREFIX,
+            task_id=self.id,
+            name=texam_name,
+            parent=parent_name,
+        )
+        job = copy.deepcopy(_get_texam_job_template())
+        job.metadata = V1ObjectMeta(name=texam_name, labels=labels)
+        job.spec.template.metadata = V1ObjectMeta(labels=labels)
+        job.spec.template.spec.volumes = get_infrastructure_security_volume() + (
+            get_tes_task_request_volume(self.id)
         )
-        logger.debug(job)
+        logger.debug("Submitting job %s", job.metadata.name)
         try:
             await self.kubernetes_client.create_job(job)
         except ApiException as e:
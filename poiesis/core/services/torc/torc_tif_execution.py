@@ -6,7 +6,6 @@ from kubernetes.client import (
     V1ObjectMeta,
 )
 
-from poiesis.api.tes.models import TesInput
 from poiesis.core.constants import get_labels, get_poiesis_core_constants
 from poiesis.core.services.torc.torc_execution_template import TorcExecutionTemplate
 
@@ -18,37 +17,33 @@ logger = logging.getLogger(__name__)
 class TorcTifExecution(TorcExecutionTemplate):
     """Tif execution class.
 
-    This class is responsible for creating the Tif Job.
+    This class is responsible for creating the Tif Job; the Tif pod reads
+    the inputs it should stage from the task-request configmap.
 
     Args:
         name: The name of the TES task will be modified for Tif Job.
-        inputs: The list of inputs that Tif will create and monitor.
 
     Attributes:
         name: The name of the TES task will be modified for Tif Job.
-        inputs: The list of inputs that Tif will create and monitor.
         message_broker: Message broker client.
         message: Message for the message broker which would to sent to TOrc.
         kubernetes_client: Kubernetes client.
     """
 
-    def __init__(self, id: str, inputs: list[TesInput] | None) -> None:
+    def __init__(self, id: str) -> None:
         """Initialize the Tif execution class.
 
         Args:
             id: The id of the TES task.
-            inputs: The list of inputs that Tif will create and monitor.
 
         Attributes:
             id: The id of the TES task.
-            inputs: The list of inputs that Tif will create and monitor.
             message_broker: Message broker client.
             message: Message for the message broker which would to sent to TOrc.
             kubernetes_client: Kubernetes client.
         """
         super().__init__()
         self._task_id = id
-        self.inputs = inputs
 
     @property
     def id(self) -> str:
@@ -57,6 +52,11 @@ class TorcTifExecution(TorcExecutionTemplate):
             raise ValueError("Task ID is None")
         return self._task_id
 
+    @property
+    def channel(self) -> str:
+        """Return the stage-scoped channel, same as the Tif job name."""
+        return f"{core_constants.K8s.TIF_PREFIX}-{self.id}"
+
     async def start_job(self) -> None:
         """Create the K8s job for Tif."""
         tif_job_name = f"{core_constants.K8s.TIF_PREFIX}-{self.id}"
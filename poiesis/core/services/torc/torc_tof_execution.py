@@ -6,7 +6,6 @@ from kubernetes.client import (
     V1ObjectMeta,
 )
 
-from poiesis.api.tes.models import TesOutput
 from poiesis.core.constants import get_labels, get_poiesis_core_constants
 from poiesis.core.services.torc.torc_execution_template import TorcExecutionTemplate
 
@@ -18,15 +17,14 @@ logger = logging.getLogger(__name__)
 class TorcTofExecution(TorcExecutionTemplate):
     """TOF execution class.
 
-    This class is responsible for creating the Tof Job.
+    This class is responsible for creating the Tof Job; the Tof pod reads
+    the outputs it should upload from the task-request configmap.
 
     Args:
         name: The name of the TES task will be modified for TOF Job.
-        outputs: The list of outputs that Tof will create and monitor.
 
     Attributes:
         name: The name of the TES task will be modified for TOF Job.
-        outputs: The list of outputs that TOF will create and monitor.
         message_broker: Message broker client.
         message: Message for the message broker which would to sent to TOrc.
         kubernetes_client: Kubernetes client.
@@ -35,24 +33,20 @@ class TorcTofExecution(TorcExecutionTemplate):
     def __init__(
         self,
         id: str,
-        outputs: list[TesOutput] | None,
     ) -> None:
         """Initialize the TOF execution class.
 
         Args:
             id: The id of the TES task.
-            outputs: The list of outputs that Tof will create and monitor.
 
         Attributes:
             id: The id of the TES task.
-            outputs: The list of outputs that TOF will create and monitor.
             message_broker: Message broker client.
             message: Message for the message broker which would to sent to TOrc.
             kubernetes_client: Kubernetes client.
         """
         super().__init__()
         self._task_id = id
-        self.outputs = outputs
 
     @property
     def id(self) -> str:
@@ -61,6 +55,11 @@ class TorcTofExecution(TorcExecutionTemplate):
             raise ValueError("Task ID is None")
         return self._task_id
 
+    @property
+    def channel(self) -> str:
+        """Return the stage-scoped channel, same as the Tof job name."""
+        return f"{core_constants.K8s.TOF_PREFIX}-{self.id}"
+
     async def start_job(self) -> None:
         """Create the K8s job for Tof."""
         tof_job_name = f"{core_constants.K8s.TOF_PREFIX}-{self.id}"
@@ -1,18 +1,25 @@
 """MongoDB adaptor for NoSQL database operations."""
 
+import asyncio
 import logging
 import os
+import re
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from functools import cached_property, lru_cache
 from typing import Any
 
+import bson
 import motor.motor_asyncio
 from bson.objectid import ObjectId
 
 from poiesis.api.exceptions import DBException
 from poiesis.api.tes.models import TesExecutorLog, TesState, TesTask, TesTaskLog
 from poiesis.constants import get_poiesis_constants
-from poiesis.core.adaptors.kubernetes.kubernetes import KubernetesAdapter
+from poiesis.core.adaptors.kubernetes.kubernetes import (
+    KubernetesAdapter,
+    get_kubernetes_client,
+)
 from poiesis.core.constants import get_poiesis_core_constants
 from poiesis.core.services.models import PodPhase
 from poiesis.repository.schemas import TaskSchema
@@ -22,9 +29,55 @@ logger = logging.getLogger(__name__)
 poiesis_constants = get_poiesis_constants()
 poiesis_core_constants = get_poiesis_core_constants()
 
+# Default page size for task listings, per the TES specification.
+_DEFAULT_PAGE_SIZE = 256
+
+if not bson.has_c():
+    # The C extension ships with pymongo's binary wheels; falling back to
+    # the pure-Python BSON codec makes every encode/decode several times
+    # slower, which is worth surfacing in log-heavy deployments.
+    logger.warning("pymongo's C extensions are not active; BSON codec is pure Python")
+
+# Executor pods are named <te_prefix>-<task UUID>-<executor idx>; compiled
+# once so update_executor_log parses and validates the name in one pass.
+_TE_POD_NAME_RE = re.compile(
+    rf"^{re.escape(poiesis_core_constants.K8s.TE_PREFIX)}-"
+    r"(?P<task_id>[0-9a-f-]{36})-(?P<idx>\d+)$"
+)
+
+
+@lru_cache
+def _get_motor_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """Return the process-wide Motor client.
+
+    Every ``MongoDBClient`` shares one underlying connection pool, so
+    instantiating the wrapper per request doesn't open a new pool (which
+    would defeat ``maxPoolSize`` and repeat the handshake/auth cost).
+    """
+    connection_string = os.getenv(poiesis_core_constants.K8s.MONGODB_URI_SECRET_KEY)
+    logger.debug(f"MongoDB connection string: {connection_string}")
+    # Task documents carry large, highly compressible log arrays, so offer
+    # wire compression; pymongo skips (with a warning) any compressor whose
+    # library isn't installed, and the server picks the first it supports.
+    mongo_constants = poiesis_constants.Database.MongoDB
+    return motor.motor_asyncio.AsyncIOMotorClient(
+        connection_string,
+        maxPoolSize=mongo_constants.MAX_POOL_SIZE,
+        minPoolSize=mongo_constants.MIN_POOL_SIZE,
+        maxIdleTimeMS=mongo_constants.MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=mongo_constants.WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=mongo_constants.SERVER_SELECTION_TIMEOUT_MS,
+        compressors="zstd,snappy,zlib",
+        zlibCompressionLevel=3,
+    )
+
 
 class MongoDBClient:
-    """Simple MongoDB client using Motor for async operations."""
+    """Simple MongoDB client using Motor for async operations.
+
+    Motor runs the blocking pymongo work, including BSON encoding, on its
+    internal thread pool, so writes never stall the asyncio event loop.
+    """
 
     def __init__(self) -> None:
         """Initialize MongoDB client with connection pooling.
@@ -34,29 +87,47 @@ class MongoDBClient:
             database: Default database name
             max_pool_size: Maximum number of connections in the pool
         """
-        self.connection_string = os.getenv(
-            poiesis_core_constants.K8s.MONGODB_URI_SECRET_KEY
-        )
-        logger.debug(f"MongoDB connection string: {self.connection_string}")
         self.database = poiesis_constants.Database.MongoDB.DATABASE
         self.max_pool_size = poiesis_constants.Database.MongoDB.MAX_POOL_SIZE
-        self.client: motor.motor_asyncio.AsyncIOMotorClient = (
-            motor.motor_asyncio.AsyncIOMotorClient(
-                self.connection_string, maxPoolSize=self.max_pool_size
-            )
-        )
+        self.client: motor.motor_asyncio.AsyncIOMotorClient = _get_motor_client()
         self.db = self.client[self.database]
-        self.kubernetes_client = KubernetesAdapter()
+        self._tasks = self.db[poiesis_constants.Database.MongoDB.TASK_COLLECTION]
 
-    async def get_task(self, task_id: str) -> TaskSchema:
+    @cached_property
+    def kubernetes_client(self) -> KubernetesAdapter:
+        """Kubernetes client, built on first use.
+
+        Only the system-log collectors talk to the cluster; pure DB callers
+        shouldn't pay for loading the kube config and TLS state when the
+        client is constructed.
+        """
+        return get_kubernetes_client()
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the client's queries rely on.
+
+        Idempotent; meant to be awaited once at API startup. Every method
+        filters on ``task_id``, so without the index each call is a
+        collection scan.
+        """
+        await self._tasks.create_index("task_id", unique=True, background=True)
+        # list_tasks filters on user_id and paginates by _id, so a compound
+        # index lets both the filter and the sort run index-backed.
+        await self._tasks.create_index([("user_id", 1), ("_id", 1)], background=True)
+
+    async def get_task(
+        self, task_id: str, projection: dict[str, Any] | None = None
+    ) -> TaskSchema:
         """Get a task from the database.
 
         Args:
             task_id: ID of the task
+            projection: Optional Mongo projection. Any projected document
+                must still satisfy ``TaskSchema``; use it to trim large
+                subtrees (e.g. ``{"data.logs": {"$slice": -1}}``) rather
+                than to drop required fields.
         """
-        task = await self.db[
-            poiesis_constants.Database.MongoDB.TASK_COLLECTION
-        ].find_one({"task_id": task_id})
+        task = await self._tasks.find_one({"task_id": task_id}, projection)
         if task is None:
             raise DBException(f"Task with ID {task_id} not found")
         return TaskSchema(**task)
@@ -74,9 +145,9 @@ class MongoDBClient:
             DBException: If the document is not valid or the insert operation fails
         """
         try:
-            result = await self.db[
-                poiesis_constants.Database.MongoDB.TASK_COLLECTION
-            ].insert_one(task.model_dump())
+            # None-valued optionals (most of a fresh task) are dropped from
+            # the stored document; absent and null read back identically.
+            result = await self._tasks.insert_one(task.model_dump(exclude_none=True))
             return str(result.inserted_id)
         except Exception as e:
             logger.error(
@@ -101,21 +172,21 @@ class MongoDBClient:
             DBException: If the update operation fails
         """
         try:
-            task = await self.get_task(task_id)
-            if task.data.state != state:
-                task.data.state = state
-                await self.db[
-                    poiesis_constants.Database.MongoDB.TASK_COLLECTION
-                ].update_one(
-                    {"task_id": task_id},
-                    {
-                        "$set": {
-                            "state": state.value,
-                            "updated_at": datetime.now(UTC),
-                            "data.state": state.value,
-                        }
+            # The state guard lives in the filter, so a no-op change costs
+            # one matched-zero update instead of a full document read plus
+            # TaskSchema validation.
+            await self._tasks.update_one(
+                {"task_id": task_id, "data.state": {"$ne": state.value}},
+                {
+                    "$set": {
+                        "state": state.value,
+                        "data.state": state.value,
                     },
-                )
+                    # Server time keeps updated_at monotonic across the API
+                    # replicas and job pods, whose clocks can drift.
+                    "$currentDate": {"updated_at": True},
+                },
+            )
         except Exception as e:
             logger.error(
                 "Error updating document in collection"
@@ -138,18 +209,11 @@ class MongoDBClient:
         """
         _log = TesTaskLog(logs=[], outputs=[])
         try:
-            task = await self.get_task(task_id)
-            task.data.logs = task.data.logs or []
-            task.data.logs.append(_log)
-            await self.db[
-                poiesis_constants.Database.MongoDB.TASK_COLLECTION
-            ].update_one(
+            # $push appends server-side, so no read round-trip and no full
+            # rewrite of the existing attempts is needed.
+            await self._tasks.update_one(
                 {"task_id": task_id},
-                {
-                    "$set": {
-                        "data.logs": [log.model_dump() for log in task.data.logs],
-                    }
-                },
+                {"$push": {"data.logs": _log.model_dump()}},
             )
         except Exception as e:
             logger.error(
@@ -168,22 +232,18 @@ class MongoDBClient:
             task_id: ID of the task
         """
         try:
-            task = await self.get_task(task_id)
-            assert task.data.logs is not None
-            task.data.logs[-1].end_time = datetime.now(UTC).strftime(
-                "%Y-%m-%dT%H:%M:%S%z"
-            )
-            await self.db[
-                poiesis_constants.Database.MongoDB.TASK_COLLECTION
-            ].update_one(
+            # Stamp the active attempt (the log without an end_time) in
+            # place; no read or full-array rewrite required.
+            await self._tasks.update_one(
                 {"task_id": task_id},
                 {
                     "$set": {
-                        # TODO: check if this can be optimized with
-                        #   data.logs[-1].end_time
-                        "data.logs": [log.model_dump() for log in task.data.logs],
+                        "data.logs.$[attempt].end_time": datetime.now(UTC).strftime(
+                            "%Y-%m-%dT%H:%M:%S%z"
+                        ),
                     }
                 },
+                array_filters=[{"attempt.end_time": None}],
             )
         except Exception as e:
             logger.error(
@@ -195,6 +255,59 @@ class MongoDBClient:
                 f"{poiesis_constants.Database.MongoDB.TASK_COLLECTION}: {e}",
             ) from e
 
+    async def _collect_system_logs(
+        self, task_id: str, system_logs: list[str] | None = None
+    ) -> list[str]:
+        """Collect pod logs of all jobs related to a task.
+
+        Args:
+            task_id: ID of the task
+            system_logs: System logs to start from, custom logs apart from the
+                pod logs.
+        """
+        # Define job prefixes to look for
+        job_prefixes = [
+            f"{poiesis_core_constants.K8s.TEXAM_PREFIX}-{task_id}",
+            f"{poiesis_core_constants.K8s.TOF_PREFIX}-{task_id}",
+            f"{poiesis_core_constants.K8s.TIF_PREFIX}-{task_id}",
+        ]
+
+        system_logs = system_logs or []
+
+        # Fan the API calls out instead of awaiting them one by one: first
+        # the pod listings per prefix, then the log fetches for every pod
+        # found. The adapter's shared semaphore already bounds in-flight
+        # API-server requests, so no extra throttling is needed here.
+        listings = await asyncio.gather(
+            *(
+                self.kubernetes_client.get_pods(label_selector=f"job-name={prefix}")
+                for prefix in job_prefixes
+            ),
+            return_exceptions=True,
+        )
+
+        pod_names: list[str] = []
+        for prefix, pods in zip(job_prefixes, listings, strict=True):
+            if isinstance(pods, BaseException):
+                system_logs.append(f"Error getting logs for {prefix}: {str(pods)}")
+                continue
+            for pod in pods:
+                assert pod.metadata is not None
+                assert pod.metadata.name is not None
+                pod_names.append(pod.metadata.name)
+
+        pod_logs_list = await asyncio.gather(
+            *(self.kubernetes_client.get_pod_log(name) for name in pod_names),
+            return_exceptions=True,
+        )
+        for name, pod_logs in zip(pod_names, pod_logs_list, strict=True):
+            if isinstance(pod_logs, BaseException):
+                system_logs.append(f"Error getting logs for {name}: {str(pod_logs)}")
+            elif pod_logs:
+                system_logs.append(f"Logs from {name}: {pod_logs}")
+
+        return system_logs
+
     async def add_tes_task_system_logs(
         self, task_id: str, system_logs: list[str] | None = None
     ) -> None:
@@ -205,50 +318,24 @@ class MongoDBClient:
             system_logs: System logs to add, custom logs apart from the pod logs.
         """
         try:
-            task = await self.get_task(task_id)
-            assert task.data.logs is not None
-
-            # Define job prefixes to look for
-            job_prefixes = [
-                f"{poiesis_core_constants.K8s.TEXAM_PREFIX}-{task_id}",
-                f"{poiesis_core_constants.K8s.TOF_PREFIX}-{task_id}",
-                f"{poiesis_core_constants.K8s.TIF_PREFIX}-{task_id}",
-            ]
-
-            system_logs = system_logs or []
-
-            # Collect logs from all related pods
-            for prefix in job_prefixes:
-                try:
-                    pods = await self.kubernetes_client.get_pods(
-                        label_selector=f"job-name={prefix}"
-                    )
-                    for pod in pods:
-                        assert pod.metadata is not None
-                        assert pod.metadata.name is not None
-                        pod_logs = await self.kubernetes_client.get_pod_log(
-                            pod.metadata.name
-                        )
-                        if pod_logs:
-                            assert pod.metadata is not None
-                            system_logs.append(
-                                f"Logs from {pod.metadata.name}: {pod_logs}"
-                            )
-                except Exception as e:
-                    system_logs.append(f"Error getting logs for {prefix}: {str(e)}")
-
-            # Add system logs to the task
-            if task.data.logs:
-                task.data.logs[-1].system_logs = system_logs
-
-                # Update the task in the database
-                await self.db[
-                    poiesis_constants.Database.MongoDB.TASK_COLLECTION
-                ].update_one(
+            # Only the attempt count is needed to address the last log, so
+            # project it instead of pulling the full document (the logs are
+            # the bulk of it for long-running tasks).
+            doc = await self._tasks.find_one(
+                {"task_id": task_id},
+                {"num_logs": {"$size": {"$ifNull": ["$data.logs", []]}}},
+            )
+            if doc is None:
+                raise DBException(f"Task with ID {task_id} not found")
+
+            system_logs = await self._collect_system_logs(task_id, system_logs)
+
+            if num_logs := doc.get("num_logs", 0):
+                await self._tasks.update_one(
                     {"task_id": task_id},
                     {
                         "$set": {
-                            "data.logs": [log.model_dump() for log in task.data.logs],
+                            f"data.logs.{num_logs - 1}.system_logs": system_logs,
                         }
                     },
                 )
@@ -262,13 +349,68 @@ class MongoDBClient:
                 f"{poiesis_constants.Database.MongoDB.TASK_COLLECTION}: {e}",
             ) from e
 
-    async def add_task_executor_log(self, task_id: str) -> None:
-        """Append a log for a task in the database.
+    async def finalize_task(
+        self,
+        task_id: str,
+        state: TesState | None = None,
+        system_logs: list[str] | None = None,
+    ) -> None:
+        """Finalize a task with a single read and a single write.
+
+        Collapses the end-of-task sequence (system logs, log end time and,
+        optionally, the terminal state) into one update instead of three
+        read-modify-write round-trips.
+
+        Args:
+            task_id: ID of the task
+            state: Terminal state of the task, or None to leave it unchanged
+            system_logs: System logs to add, custom logs apart from the pod logs.
+        """
+        try:
+            # Only the attempt count is needed to address the last log, so
+            # project it instead of pulling the full document.
+            doc = await self._tasks.find_one(
+                {"task_id": task_id},
+                {"num_logs": {"$size": {"$ifNull": ["$data.logs", []]}}},
+            )
+            if doc is None:
+                raise DBException(f"Task with ID {task_id} not found")
+            num_logs = doc.get("num_logs", 0)
+            assert num_logs, "add_task_log should have created an attempt"
+
+            system_logs = await self._collect_system_logs(task_id, system_logs)
+
+            prefix = f"data.logs.{num_logs - 1}"
+            update = {
+                f"{prefix}.system_logs": system_logs,
+                f"{prefix}.end_time": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S%z"),
+            }
+            if state is not None:
+                update["state"] = state.value
+                update["data.state"] = state.value
+
+            await self._tasks.update_one(
+                {"task_id": task_id},
+                {"$set": update, "$currentDate": {"updated_at": True}},
+            )
+        except Exception as e:
+            logger.error(
+                "Error finalizing task in collection "
+                f"{poiesis_constants.Database.MongoDB.TASK_COLLECTION}: {str(e)}"
+            )
+            raise DBException(
+                "Error finalizing task in collection "
+                f"{poiesis_constants.Database.MongoDB.TASK_COLLECTION}: {e}",
+            ) from e
+
+    async def add_task_executor_log(self, task_id: str, count: int = 1) -> None:
+        """Append one or more executor logs for a task in the database.
 
         Each executor has a log.
 
         Args:
             task_id: ID of the task
+            count: Number of blank logs to append in a single write.
 
         Note:
             This assumes that the executors are called sequentially, hence we will just
@@ -277,21 +419,22 @@ class MongoDBClient:
         # XXX: We initialize the log with exit code 0
         _log = TesExecutorLog(exit_code=0)
         try:
-            task = await self.get_task(task_id)
-            # This shouldn't be needed as add_task_log should have been called
-            task.data.logs = task.data.logs or []
-            # Last logs is the current task log, hence we pick the last one
-            task.data.logs[-1].logs.append(_log)
-            await self.db[
-                poiesis_constants.Database.MongoDB.TASK_COLLECTION
-            ].update_one(
+            # Append to the active attempt (the log without an end_time)
+            # server-side; no read and no rewrite of the earlier attempts.
+            result = await self._tasks.update_one(
                 {"task_id": task_id},
                 {
-                    "$set": {
-                        "data.logs": [log.model_dump() for log in task.data.logs],
+                    "$push": {
+                        "data.logs.$[attempt].logs": {
+                            "$each": [_log.model_dump() for _ in range(count)]
+                        }
                     }
                 },
+                array_filters=[{"attempt.end_time": None}],
             )
+            if result.modified_count == 0:
+                # add_task_log should have created an open attempt first.
+                raise DBException(f"Task {task_id} has no active attempt log")
         except Exception as e:
             logger.error(
                 "Error upserting task log in collection"
@@ -325,35 +468,33 @@ class MongoDBClient:
             stderr: Standard error of the pod
         """
         try:
-            # Note: The executor name is of the form <te_prefix>-<UUID>-<idx>.
-            pod_name_without_prefix = job_name.split(
-                f"{poiesis_core_constants.K8s.TE_PREFIX}-"
-            )[-1]
-            parts = pod_name_without_prefix.split("-")
-            idx = int(parts[-1])
-
-            # UUID has 6 parts, hence we take the first 5
-            task_id = "-".join(parts[:5])
-
-            task = await self.get_task(task_id)
-            assert task.data.logs is not None
-
-            exec_log = task.data.logs[-1].logs[idx]
-
-            exec_log.end_time = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S%z")
-            exec_log.stderr = stderr or ""
-            exec_log.stdout = stdout
-            exec_log.exit_code = 0 if pod_phase == PodPhase.SUCCEEDED.value else 1
-
-            await self.db[
-                poiesis_constants.Database.MongoDB.TASK_COLLECTION
-            ].update_one(
+            match = _TE_POD_NAME_RE.match(job_name)
+            if match is None:
+                raise ValueError(f"Unexpected executor job name: {job_name}")
+            task_id = match["task_id"]
+            idx = int(match["idx"])
+
+            # Target the executor's entry inside the active attempt (the one
+            # without an end_time) with a positional update. Only the four
+            # changed fields cross the wire, and no read or full-array
+            # rewrite is needed — concurrent executor updates can't clobber
+            # each other.
+            prefix = f"data.logs.$[attempt].logs.{idx}"
+            await self._tasks.update_one(
                 {"task_id": task_id},
                 {
                     "$set": {
-                        "data.logs": [log.model_dump() for log in task.data.logs],
+                        f"{prefix}.end_time": datetime.now(UTC).strftime(
+                            "%Y-%m-%dT%H:%M:%S%z"
+                        ),
+                        f"{prefix}.stderr": stderr or "",
+                        f"{prefix}.stdout": stdout,
+                        f"{prefix}.exit_code": 0
+                        if pod_phase == PodPhase.SUCCEEDED.value
+                        else 1,
                     }
                 },
+                array_filters=[{"attempt.end_time": None}],
             )
         except Exception as e:
             logger.error(
@@ -378,6 +519,9 @@ class MongoDBClient:
             tuple[list[TesTask], Optional[str]]: list of tasks matching the query,
                 and next page token
         """
+        # The TES spec defaults page_size to 256; buffering an unbounded
+        # result set (to_list(None)) would grow with the collection.
+        page_size = page_size or _DEFAULT_PAGE_SIZE
         db_query = query.copy()
 
         # If there's a next page token, filter documents after that ID
@@ -387,21 +531,20 @@ class MongoDBClient:
             except Exception as e:
                 raise ValueError("Invalid next_page_token") from e
 
+        # Only data and _id leave the server; the envelope fields (tags,
+        # user_id, service_hash, ...) aren't part of the response.
         cursor = (
-            self.db[poiesis_constants.Database.MongoDB.TASK_COLLECTION]
-            .find(db_query)
+            self._tasks.find(db_query, {"data": 1, "_id": 1})
             .sort("_id", 1)
+            .limit(page_size + 1)
         )
 
-        if page_size is not None:
-            cursor = cursor.limit(page_size + 1)
-
-        docs = await cursor.to_list(None)
+        docs = await cursor.to_list(page_size + 1)
 
         tasks = [TesTask(**doc["data"]) for doc in docs[:page_size]]
 
         next_token = None
-        if page_size is not None and len(docs) > page_size:
+        if len(docs) > page_size:
             next_token = str(docs[page_size]["_id"])
 
         return tasks, next_token
@@ -419,6 +562,28 @@ class MongoDBClient:
             # Motor handles connection pooling internally
             pass
 
+    async def ping(self) -> None:
+        """Round-trip the server once.
+
+        Awaited at startup so bad credentials or an unreachable server
+        surface immediately instead of on the first real request.
+        """
+        await self.client.admin.command("ping")
+
     async def close(self):
-        """Close all connections in the pool."""
+        """Close all connections in the pool.
+
+        Motor's close() is synchronous in the driver versions pinned here;
+        it tears the pool down without needing a further await.
+        """
         self.client.close()
+
+
+@lru_cache
+def get_mongo_client() -> MongoDBClient:
+    """Get the process-wide shared MongoDB client.
+
+    Motor manages its own connection pool, so a single client shared across
+    services avoids re-establishing connections for every instance.
+    """
+    return MongoDBClient()
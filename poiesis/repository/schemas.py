@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 from typing import Annotated, Any
 
 from bson import ObjectId
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from pydantic_core import core_schema
 
 from poiesis.api.constants import PoiesisApiConstants
@@ -24,14 +24,12 @@ class _ObjectIdPydanticAnnotation:
         _source_type: Any,
         _handler: Callable[[Any], core_schema.CoreSchema],
     ) -> core_schema.CoreSchema:
-        def validate_from_str(input_value: str) -> ObjectId:
-            return ObjectId(input_value)
-
         return core_schema.union_schema(
             [
                 # check if it's an instance first before doing any further work
                 core_schema.is_instance_schema(ObjectId),
-                core_schema.no_info_plain_validator_function(validate_from_str),
+                # ObjectId accepts the string directly; no wrapper frame needed
+                core_schema.no_info_plain_validator_function(ObjectId),
             ],
             serialization=core_schema.to_string_ser_schema(),
         )
@@ -85,11 +83,7 @@ class TaskSchema(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     data: TesTask
 
-    class Config:
-        """Pydantic configuration."""
-
-        populate_by_name = True
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
 
     @field_serializer("state")
     def serialize_state(self, v: TesState) -> str:
@@ -125,8 +119,4 @@ class ServiceSchema(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     data: Service = Field(frozen=True)
 
-    class Config:
-        """Pydantic configuration."""
-
-        populate_by_name = True
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)